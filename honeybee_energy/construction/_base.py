@@ -10,6 +10,9 @@ from honeybee.typing import valid_ep_string
 
 import math
 
+# comments for the name and up to 10 material layers of an IDF Construction
+_IDF_COMMENTS = ('name',) + tuple('layer %s' % (i + 1) for i in range(10))
+
 
 @lockable
 class _ConstructionBase(object):
@@ -29,7 +32,7 @@ class _ConstructionBase(object):
     # generic air material used to compute indoor film coefficients.
     _air = EnergyWindowMaterialGas('generic air', gas_type='Air')
 
-    __slots__ = ('_name', '_materials', '_locked')
+    __slots__ = ('_name', '_materials', '_hash', '_locked')
 
     def __init__(self, name, materials):
         """Initialize energy construction.
@@ -40,6 +43,7 @@ class _ConstructionBase(object):
             materials: List of materials in the construction (from outside to inside).
         """
         self._locked = False  # unlocked by default
+        self._hash = None  # hash is only cached while the object is locked
         self.name = name
         self.materials = materials
 
@@ -68,11 +72,18 @@ class _ConstructionBase(object):
 
     @property
     def unique_materials(self):
-        """A set of only unique material objects in the construction.
+        """A list of only unique material objects in the construction.
 
-        This is useful when constructions reuse material layers.
+        This is useful when constructions reuse material layers. Materials are
+        returned in the order that they first appear (from outside to inside).
         """
-        return list(set(self._materials))
+        unique_mats = []
+        mat_set = set()
+        for mat in self._materials:
+            if mat not in mat_set:
+                mat_set.add(mat)
+                unique_mats.append(mat)
+        return unique_mats
     
     @property
     def inside_emissivity(self):
@@ -87,7 +98,7 @@ class _ConstructionBase(object):
     @property
     def r_value(self):
         """R-value of the construction [m2-K/W] (excluding air films)."""
-        return sum(tuple(mat.r_value for mat in self.materials))
+        return sum(mat.r_value for mat in self._materials)
 
     @property
     def u_value(self):
@@ -121,9 +132,11 @@ class _ConstructionBase(object):
         helpful for interior constructions, which need to have matching materials
         in reveresed order between adjacent Faces.
         """
-        half_mat = int(len(self._materials) / 2)
-        for i in range(half_mat):
-            if self._materials[i] != self._materials[-(i + 1)]:
+        mats = self._materials
+        for i in range(len(mats) // 2):
+            mat, rev_mat = mats[i], mats[-(i + 1)]
+            # reused layers are the same object, which avoids a full __eq__ check
+            if mat is not rev_mat and mat != rev_mat:
                 return False
         return True
 
@@ -217,6 +230,7 @@ class _ConstructionBase(object):
     def unlock(self):
         """The unlock() method will also unlock the materials."""
         self._locked = False
+        self._hash = None
         for mat in self.materials:
             mat.unlock()
 
@@ -226,16 +240,18 @@ class _ConstructionBase(object):
         r_factor = sum(r_values)
         delta_t = inside_temperature - outside_temperature
         temperatures = [outside_temperature]
-        for i, r_val in enumerate(r_values):
-            temperatures.append(temperatures[i] + (delta_t * (r_val / r_factor)))
+        temp = outside_temperature
+        for r_val in r_values:
+            temp = temp + (delta_t * (r_val / r_factor))
+            temperatures.append(temp)
         return temperatures
 
     @staticmethod
     def _generate_idf_string(constr_type, name, materials):
         """Get an EnergyPlus string representation from values and comments."""
         values = (name,) + tuple(mat.name for mat in materials)
-        comments = ('name',) + tuple('layer %s' % (i + 1) for i in range(len(materials)))
-        return generate_idf_string('Construction', values, comments)
+        return generate_idf_string(
+            'Construction', values, _IDF_COMMENTS[:len(materials) + 1])
 
     def __copy__(self):
         return self.__class__(self.name, [mat.duplicate() for mat in self.materials])
@@ -254,7 +270,12 @@ class _ConstructionBase(object):
         return (self.name,) + tuple(hash(mat) for mat in self.materials)
 
     def __hash__(self):
-        return hash(self.__key())
+        h = self._hash
+        if h is None:
+            h = hash(self.__key())
+            if self._locked:  # materials cannot change; cache the hash
+                object.__setattr__(self, '_hash', h)
+        return h
 
     def __eq__(self, other):
         return isinstance(other, _ConstructionBase) and self.__key() == other.__key()
@@ -81,21 +81,18 @@ class OpaqueConstruction(_ConstructionBase):
     @property
     def mass_area_density(self):
         """The area density of the construction [kg/m2]."""
-        return sum(tuple(mat.mass_area_density for mat in self.materials))
+        return sum(mat.mass_area_density for mat in self._materials)
 
     @property
     def area_heat_capacity(self):
         """The heat capacity per unit area of the construction [kg/K-m2]."""
-        return sum(tuple(mat.area_heat_capacity for mat in self.materials))
+        return sum(mat.area_heat_capacity for mat in self._materials)
 
     @property
     def thickness(self):
         """Thickness of the construction [m]."""
-        thickness = 0
-        for mat in self.materials:
-            if isinstance(mat, EnergyMaterial):
-                thickness += mat.thickness
-        return thickness
+        return sum(mat.thickness for mat in self._materials
+                   if isinstance(mat, EnergyMaterial))
 
     def temperature_profile(self, outside_temperature=-18, inside_temperature=21,
                             outside_wind_speed=6.7, height=1.0, angle=90.0,
@@ -9,6 +9,10 @@ from ..writer import generate_idf_string
 from honeybee._lockable import lockable
 from honeybee.typing import valid_ep_string, float_in_range
 
+_SPECULAR_IDF_COMMENTS = (
+    'shading surface name', 'solar reflectance', 'visible reflectance',
+    'fraction of shading surface that is glazed', 'glazing construction name')
+
 
 @lockable
 class ShadeConstruction(object):
@@ -137,17 +141,14 @@ class ShadeConstruction(object):
             host_shade_name: Text string for the name of a Shade object that
                 possesses this ShadeConstruction.
         """
-        values = [host_shade_name, self.solar_reflectance, self.visible_reflectance]
-        if self.is_specular:
-            values.extend([1, self.name])
-            comments = ('shading surface name', 'solar reflectance',
-                        'visible reflectance',
-                        'fraction of shading surface that is glazed',
-                        'glazing construction name')
-        else:
-            comments = ('shading surface name', 'solar reflectance',
-                        'visible reflectance')
-        return generate_idf_string('ShadingProperty:Reflectance', values, comments)
+        if self._is_specular:
+            values = (host_shade_name, self._solar_reflectance,
+                      self._visible_reflectance, 1, self._name)
+            return generate_idf_string(
+                'ShadingProperty:Reflectance', values, _SPECULAR_IDF_COMMENTS)
+        values = (host_shade_name, self._solar_reflectance, self._visible_reflectance)
+        return generate_idf_string(
+            'ShadingProperty:Reflectance', values, _SPECULAR_IDF_COMMENTS[:3])
 
     def to_radiance_solar(self):
         """Honeybee Radiance material with the solar reflectance."""
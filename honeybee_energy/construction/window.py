@@ -293,15 +293,9 @@ class WindowConstruction(_ConstructionBase):
         avg_guess = ((inside_temperature + outside_temperature) / 2) + 273.15
         r_values, emissivities = self._layered_r_value_initial(
             gap_count, guess, avg_guess, wind_speed)
-        r_last = 0
-        r_next = sum(r_values)
-        while abs(r_next - r_last) > 0.001:  # 0.001 is the r-value tolerance
-            r_last = sum(r_values)
-            temperatures = self._temperature_profile_from_r_values(
-                r_values, outside_temperature, inside_temperature)
-            r_values = self._layered_r_value(
-                temperatures, r_values, emissivities, height, angle, pressure)
-            r_next = sum(r_values)
+        r_values = self._solve_r_values(
+            r_values, emissivities, outside_temperature, inside_temperature,
+            height, angle, pressure)
         temperatures = self._temperature_profile_from_r_values(
             r_values, outside_temperature, inside_temperature)
         return temperatures, r_values
@@ -510,14 +504,18 @@ class WindowConstruction(_ConstructionBase):
                 materials_dict[mat_obj.name] = mat_obj
         return materials_dict
 
-    def _solve_r_values(self, r_vals, emissivities):
+    def _solve_r_values(self, r_vals, emissivities, outside_temperature=-18,
+                        inside_temperature=21, height=1.0, angle=90.0,
+                        pressure=101325):
         """Iteratively solve for R-values."""
         r_last = 0
         r_next = sum(r_vals)
         while abs(r_next - r_last) > 0.001:  # 0.001 is the r-value tolerance
-            r_last = sum(r_vals)
-            temperatures = self._temperature_profile_from_r_values(r_vals)
-            r_vals = self._layered_r_value(temperatures, r_vals, emissivities)
+            r_last = r_next
+            temperatures = self._temperature_profile_from_r_values(
+                r_vals, outside_temperature, inside_temperature)
+            r_vals = self._layered_r_value(
+                temperatures, r_vals, emissivities, height, angle, pressure)
             r_next = sum(r_vals)
         return r_vals
 
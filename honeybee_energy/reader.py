@@ -1,6 +1,8 @@
 """Methods to read from idf."""
 import re
 
+_COMMENT_PATTERN = re.compile(r'!.*\n')
+
 
 def parse_idf_string(idf_string, expected_type=None):
     """Parse an EnergyPlus string of a single object into a list of values.
@@ -21,7 +23,8 @@ def parse_idf_string(idf_string, expected_type=None):
             'but received a differet object: {}'.format(expected_type, idf_string)
     idf_strings = idf_string.split(';')
     assert len(idf_strings) == 2, 'Received more than one object in idf_string.'
-    idf_string = re.sub(r'!.*\n', '', idf_strings[0])
+    idf_string = _COMMENT_PATTERN.sub('', idf_strings[0]) \
+        if '!' in idf_strings[0] else idf_strings[0]
     ep_fields = [e_str.strip() for e_str in idf_string.split(',')]
     ep_fields.pop(0)  # remove the EnergyPlus object name
     return ep_fields
@@ -542,7 +542,15 @@ class ScheduleDay(object):
         return not self.__eq__(other)
 
     def __copy__(self):
-        return ScheduleDay(self.name, self.values, self.times, self.interpolate)
+        # the properties are already validated and the tuples can be shared
+        new_day = ScheduleDay.__new__(ScheduleDay)
+        new_day._locked = False
+        new_day._parent = None
+        new_day._name = self._name
+        new_day._values = self._values
+        new_day._times = self._times
+        new_day._interpolate = self._interpolate
+        return new_day
 
     def ToString(self):
         """Overwrite .NET ToString."""
@@ -9,6 +9,58 @@ from honeybee._lockable import lockable
 
 from ladybug.dt import Date
 
+import re
+from collections import namedtuple
+
+# bits of the integer mask used to store the days on which a ScheduleRule is applied
+_SUNDAY = 1 << 0
+_MONDAY = 1 << 1
+_TUESDAY = 1 << 2
+_WEDNESDAY = 1 << 3
+_THURSDAY = 1 << 4
+_FRIDAY = 1 << 5
+_SATURDAY = 1 << 6
+_HOLIDAY = 1 << 7
+_WEEKDAY = _MONDAY | _TUESDAY | _WEDNESDAY | _THURSDAY | _FRIDAY
+_WEEKEND = _SUNDAY | _SATURDAY
+_ALL_DAYS = _WEEKDAY | _WEEKEND | _HOLIDAY
+_DAY_NAMES = ('sunday', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday',
+              'saturday', 'holiday')  # names of the days in order of the mask bits
+_MaskProperties = namedtuple(
+    '_MaskProperties',
+    ('week_tuple', 'days_applied', 'is_weekday', 'is_weekend', 'is_all'))
+
+
+def _mask_properties(mask):
+    """Get the _MaskProperties derived from an integer apply mask."""
+    return _MaskProperties(
+        tuple(mask & (1 << i) != 0 for i in range(7)),
+        tuple(name for i, name in enumerate(_DAY_NAMES) if mask & (1 << i)),
+        mask & _WEEKDAY == _WEEKDAY, mask & _WEEKEND == _WEEKEND, mask == _ALL_DAYS)
+
+
+# derived properties for each of the 256 possible masks
+_MASK_TABLE = tuple(_mask_properties(mask) for mask in range(_ALL_DAYS + 1))
+
+# masks for the day types that can be used in a Schedule:Week:Compact
+_COMPACT_DAY_MASKS = {
+    'alldays': _ALL_DAYS, 'weekdays': _WEEKDAY, 'weekends': _WEEKEND,
+    'sunday': _SUNDAY, 'monday': _MONDAY, 'tuesday': _TUESDAY,
+    'wednesday': _WEDNESDAY, 'thursday': _THURSDAY, 'friday': _FRIDAY,
+    'saturday': _SATURDAY, 'holiday': _HOLIDAY}
+_COMPACT_DAY_PATTERN = re.compile(
+    r'allotherdays|alldays|weekdays|weekends|sunday|monday|tuesday|wednesday|'
+    r'thursday|friday|saturday|holiday')
+
+
+def _applies_on_day(start_doy, end_doy, apply_mask, doy, dow):
+    """Check if the doy range and apply mask of a rule cover a given doy and dow.
+
+    This is used within loops over every day of the year, where the rule properties
+    can be pulled out of the ScheduleRule once and passed in for each day.
+    """
+    return start_doy <= doy <= end_doy and (apply_mask >> (dow - 1)) & 1 == 1
+
 
 @lockable
 class ScheduleRule(object):
@@ -36,13 +88,13 @@ class ScheduleRule(object):
         days_applied
         week_apply_tuple
     """
-    __slots__ = ('_schedule_day', '_apply_sunday', '_apply_monday', '_apply_tuesday',
-                 '_apply_wednesday', '_apply_thursday', '_apply_friday',
-                 '_apply_saturday', '_apply_holiday', '_start_date', '_end_date',
-                 '_start_doy', '_end_doy', '_locked')
+    __slots__ = ('_schedule_day', '_apply_mask', '_start_date', '_end_date',
+                 '_start_doy', '_end_doy', '_hash', '_locked')
 
     _year_start = Date(1, 1)
     _year_end = Date(12, 31)
+    _year_start_doy = 1
+    _year_end_doy = 365
 
     def __init__(self, schedule_day, apply_sunday=False, apply_monday=False,
                  apply_tuesday=False, apply_wednesday=False, apply_thursday=False,
@@ -66,6 +118,8 @@ class ScheduleRule(object):
                 the schedule_day will be applied. If None, Dec 31 will be used.
         """
         self._locked = False  # unlocked by default
+        self._hash = None  # hash is only cached once the rule is locked
+        self._apply_mask = 0  # not applied to any day by default
         self.schedule_day = schedule_day
         self.apply_sunday = apply_sunday
         self.apply_monday = apply_monday
@@ -80,9 +134,10 @@ class ScheduleRule(object):
         if start_date is not None:
             self._check_date(start_date, 'start_date')
             self._start_date = start_date
+            self._start_doy = self._doy_non_leap_year(start_date)
         else:
             self._start_date = self._year_start
-        self._start_doy = self._doy_non_leap_year(self._start_date)
+            self._start_doy = self._year_start_doy
         self.end_date = end_date
 
     @property
@@ -99,107 +154,111 @@ class ScheduleRule(object):
     @property
     def apply_sunday(self):
         """Get or set a boolean noting whether to apply schedule_day on Sundays."""
-        return self._apply_sunday
+        return (self._apply_mask & _SUNDAY) != 0
 
     @apply_sunday.setter
     def apply_sunday(self, value):
-        self._apply_sunday = bool(value)
+        self._apply_mask = (self._apply_mask | _SUNDAY) if value \
+            else (self._apply_mask & ~_SUNDAY)
 
     @property
     def apply_monday(self):
         """Get or set a boolean noting whether to apply schedule_day on Mondays."""
-        return self._apply_monday
+        return (self._apply_mask & _MONDAY) != 0
 
     @apply_monday.setter
     def apply_monday(self, value):
-        self._apply_monday = bool(value)
+        self._apply_mask = (self._apply_mask | _MONDAY) if value \
+            else (self._apply_mask & ~_MONDAY)
 
     @property
     def apply_tuesday(self):
         """Get or set a boolean noting whether to apply schedule_day on Tuesdays."""
-        return self._apply_tuesday
+        return (self._apply_mask & _TUESDAY) != 0
 
     @apply_tuesday.setter
     def apply_tuesday(self, value):
-        self._apply_tuesday = bool(value)
+        self._apply_mask = (self._apply_mask | _TUESDAY) if value \
+            else (self._apply_mask & ~_TUESDAY)
 
     @property
     def apply_wednesday(self):
         """Get or set a boolean noting whether to apply schedule_day on Wednesdays."""
-        return self._apply_wednesday
+        return (self._apply_mask & _WEDNESDAY) != 0
 
     @apply_wednesday.setter
     def apply_wednesday(self, value):
-        self._apply_wednesday = bool(value)
+        self._apply_mask = (self._apply_mask | _WEDNESDAY) if value \
+            else (self._apply_mask & ~_WEDNESDAY)
 
     @property
     def apply_thursday(self):
         """Get or set a boolean noting whether to apply schedule_day on Thursdays."""
-        return self._apply_thursday
+        return (self._apply_mask & _THURSDAY) != 0
 
     @apply_thursday.setter
     def apply_thursday(self, value):
-        self._apply_thursday = bool(value)
+        self._apply_mask = (self._apply_mask | _THURSDAY) if value \
+            else (self._apply_mask & ~_THURSDAY)
 
     @property
     def apply_friday(self):
         """Get or set a boolean noting whether to apply schedule_day on Fridays."""
-        return self._apply_friday
+        return (self._apply_mask & _FRIDAY) != 0
 
     @apply_friday.setter
     def apply_friday(self, value):
-        self._apply_friday = bool(value)
+        self._apply_mask = (self._apply_mask | _FRIDAY) if value \
+            else (self._apply_mask & ~_FRIDAY)
 
     @property
     def apply_saturday(self):
         """Get or set a boolean noting whether to apply schedule_day on Saturdays."""
-        return self._apply_saturday
+        return (self._apply_mask & _SATURDAY) != 0
 
     @apply_saturday.setter
     def apply_saturday(self, value):
-        self._apply_saturday = bool(value)
+        self._apply_mask = (self._apply_mask | _SATURDAY) if value \
+            else (self._apply_mask & ~_SATURDAY)
 
     @property
     def apply_holiday(self):
         """Get or set a boolean noting whether to apply schedule_day on Holidays."""
-        return self._apply_holiday
+        return (self._apply_mask & _HOLIDAY) != 0
 
     @apply_holiday.setter
     def apply_holiday(self, value):
-        self._apply_holiday = bool(value)
+        self._apply_mask = (self._apply_mask | _HOLIDAY) if value \
+            else (self._apply_mask & ~_HOLIDAY)
 
     @property
     def apply_weekday(self):
         """Get or set a boolean noting whether to apply schedule_day on week days."""
-        return self._apply_monday and self._apply_tuesday and self._apply_wednesday and \
-            self._apply_thursday and self._apply_friday
+        return _MASK_TABLE[self._apply_mask].is_weekday
 
     @apply_weekday.setter
     def apply_weekday(self, value):
-        self._apply_monday = self._apply_tuesday = self._apply_wednesday = \
-            self._apply_thursday = self._apply_friday = bool(value)
+        self._apply_mask = (self._apply_mask | _WEEKDAY) if value \
+            else (self._apply_mask & ~_WEEKDAY)
 
     @property
     def apply_weekend(self):
         """Get or set a boolean noting whether to apply schedule_day on weekends."""
-        return self._apply_sunday and self._apply_saturday
+        return _MASK_TABLE[self._apply_mask].is_weekend
 
     @apply_weekend.setter
     def apply_weekend(self, value):
-        self._apply_sunday = self._apply_saturday = bool(value)
+        self._apply_mask = (self._apply_mask | _WEEKEND) if value \
+            else (self._apply_mask & ~_WEEKEND)
 
     @property
     def apply_all(self):
         """Get or set a boolean noting whether to apply schedule_day on all days."""
-        return self._apply_sunday and self._apply_monday and self._apply_tuesday and \
-            self._apply_wednesday and self._apply_thursday and self._apply_friday and \
-            self._apply_saturday and self._apply_holiday
+        return _MASK_TABLE[self._apply_mask].is_all
 
     @apply_all.setter
     def apply_all(self, value):
-        self._apply_sunday = self._apply_monday = self._apply_tuesday = \
-            self._apply_wednesday = self._apply_thursday = self._apply_friday = \
-            self._apply_saturday = self._apply_holiday = bool(value)
+        self._apply_mask = _ALL_DAYS if value else 0
 
     @property
     def start_date(self):
@@ -211,10 +270,12 @@ class ScheduleRule(object):
         if value is not None:
             self._check_date(value, 'start_date')
             self._start_date = value
+            start_doy = self._doy_non_leap_year(value)
         else:
             self._start_date = self._year_start
+            start_doy = self._year_start_doy
         self._check_start_before_end()
-        self._start_doy = self._doy_non_leap_year(self._start_date)
+        self._start_doy = start_doy
 
     @property
     def end_date(self):
@@ -226,27 +287,22 @@ class ScheduleRule(object):
         if value is not None:
             self._check_date(value, 'end_date')
             self._end_date = value
+            end_doy = self._doy_non_leap_year(value)
         else:
             self._end_date = self._year_end
+            end_doy = self._year_end_doy
         self._check_start_before_end()
-        self._end_doy = self._doy_non_leap_year(self._end_date)
+        self._end_doy = end_doy
 
     @property
     def days_applied(self):
         """Get a list of text values for the days applied."""
-        day_names = ('sunday', 'monday', 'tuesday', 'wednesday', 'thursday',
-                     'friday', 'saturday')
-        days = [name for name, apply in zip(day_names, self.week_apply_tuple) if apply]
-        if self.apply_holiday:
-            days.append('holiday')
-        return days
+        return list(_MASK_TABLE[self._apply_mask].days_applied)
 
     @property
     def week_apply_tuple(self):
         """Get a tuple of 7 booleans for each of the days of the week."""
-        return (self._apply_sunday, self._apply_monday, self._apply_tuesday,
-                self._apply_wednesday, self._apply_thursday, self._apply_friday,
-                self._apply_saturday)
+        return _MASK_TABLE[self._apply_mask].week_tuple
 
     def apply_day_by_name(self, day_name):
         """Set the rule to apply to the day of the week (or holidays) by its name.
@@ -328,8 +384,9 @@ class ScheduleRule(object):
                 this value will be derived from the doy, assuming the first day of
                 the year is a Sunday.
         """
-        dow = dow if dow is not None else doy % 7
-        return self.does_rule_apply_doy(doy) and self.week_apply_tuple[dow - 1]
+        dow = dow if dow is not None else doy % 7 or 7
+        return _applies_on_day(
+            self._start_doy, self._end_doy, self._apply_mask, doy, dow)
 
     def does_rule_apply_leap_year(self, doy, dow=None):
         """Check if this rule applies to a given day of a leap year and day of the week.
@@ -340,8 +397,10 @@ class ScheduleRule(object):
                 this value will be derived from the doy, assuming the first day of
                 the year is a Sunday.
         """
-        dow = dow if dow is not None else doy % 7
-        return self.does_rule_apply_doy_leap_year(doy) and self.week_apply_tuple[dow - 1]
+        dow = dow if dow is not None else doy % 7 or 7
+        st_doy = self._start_doy if self._start_date.month <= 2 else self._start_doy + 1
+        end_doy = self._end_doy if self._end_date.month <= 2 else self._end_doy + 1
+        return _applies_on_day(st_doy, end_doy, self._apply_mask, doy, dow)
 
     def does_rule_apply_doy(self, doy):
         """Check if this rule applies to a given day of the year.
@@ -418,18 +477,20 @@ class ScheduleRule(object):
             'Expected ScheduleRule. Got {}.'.format(data['type'])
 
         schedule_day = ScheduleDay.from_dict(data['schedule_day'])
-        apply_sunday = data['apply_sunday'] if 'apply_sunday' in data else False
-        apply_monday = data['apply_monday'] if 'apply_monday' in data else False
-        apply_tuesday = data['apply_tuesday'] if 'apply_tuesday' in data else False
-        apply_wednesday = data['apply_wednesday'] if 'apply_wednesday' in data else False
-        apply_thursday = data['apply_thursday'] if 'apply_thursday' in data else False
-        apply_friday = data['apply_friday'] if 'apply_friday' in data else False
-        apply_saturday = data['apply_saturday'] if 'apply_saturday' in data else False
-        apply_holiday = data['apply_holiday'] if 'apply_holiday' in data else False
-        start_date = Date.from_array(data['start_date']) if \
-            'start_date' in data else cls._year_start
-        end_date = Date.from_array(data['end_date']) if \
-            'end_date' in data else cls._year_end
+        apply_sunday = data.get('apply_sunday', False)
+        apply_monday = data.get('apply_monday', False)
+        apply_tuesday = data.get('apply_tuesday', False)
+        apply_wednesday = data.get('apply_wednesday', False)
+        apply_thursday = data.get('apply_thursday', False)
+        apply_friday = data.get('apply_friday', False)
+        apply_saturday = data.get('apply_saturday', False)
+        apply_holiday = data.get('apply_holiday', False)
+        start_date = data.get('start_date')
+        if start_date is not None:
+            start_date = Date.from_array(start_date)
+        end_date = data.get('end_date')
+        if end_date is not None:
+            end_date = Date.from_array(end_date)
 
         return cls(schedule_day, apply_sunday, apply_monday, apply_tuesday,
                    apply_wednesday, apply_thursday, apply_friday, apply_saturday,
@@ -463,6 +524,7 @@ class ScheduleRule(object):
     def unlock(self):
         """The unlock() method will also unlock the schedule_day."""
         self._locked = False
+        self._hash = None
         self.schedule_day.unlock()
 
     @staticmethod
@@ -485,56 +547,56 @@ class ScheduleRule(object):
             schedule_rules: A list of ScheduleRule objects that together describe
                 the Schedule:Week.
         """
+        is_daily = week_idf_string.startswith('Schedule:Week:Daily,')
+        ep_strs = parse_idf_string(week_idf_string) if is_daily else \
+            parse_idf_string(week_idf_string, 'Schedule:Week:Compact,')
+        return ScheduleRule._extract_all_from_week_fields(
+            ep_strs, is_daily, day_schedule_dict, start_date, end_date)
+
+    @staticmethod
+    def _extract_all_from_week_fields(ep_strs, is_daily, day_schedule_dict,
+                                      start_date=None, end_date=None):
+        """Extract all ScheduleRule objects from the parsed fields of a Schedule:Week.
+
+        Args:
+            ep_strs: A list of fields for a Schedule:Week object as returned
+                by parse_idf_string.
+            is_daily: Boolean to note whether the fields are for a
+                Schedule:Week:Daily (True) or a Schedule:Week:Compact (False).
+            day_schedule_dict: A dictionary with the names of ScheduleDay objects as
+                keys and the corresponding ScheduleDay objects as values.
+            start_date: A ladybug Date object for the start of the period over which
+                the ScheduleRules apply. If None, Jan 1 will be used.
+            end_date: A ladybug Date object for the end of the period over which
+                the ScheduleRules apply. If None, Dec 31 will be used.
+        """
         schedule_rules = []
-        if week_idf_string.startswith('Schedule:Week:Daily,'):
-            ep_strs = parse_idf_string(week_idf_string)
-            applied_day_names = []
+        if is_daily:
+            applied_day_rules = {}
             for i, day_sch_name in enumerate(ep_strs[1:9]):
-                if day_sch_name not in applied_day_names:  # make a new rule
+                if day_sch_name not in applied_day_rules:  # make a new rule
                     rule = ScheduleRule(day_schedule_dict[day_sch_name],
                                         start_date=start_date, end_date=end_date)
                     rule.apply_day_by_dow(i + 1)
                     schedule_rules.append(rule)
-                    applied_day_names.append(day_sch_name)
+                    applied_day_rules[day_sch_name] = rule
                 else:  # edit one of the existing rules to apply it to the new day
-                    sch_rule_index = applied_day_names.index(day_sch_name)
-                    rule = schedule_rules[sch_rule_index]
-                    rule.apply_day_by_dow(i + 1)
+                    applied_day_rules[day_sch_name].apply_day_by_dow(i + 1)
         else:
-            ep_strs = parse_idf_string(week_idf_string, 'Schedule:Week:Compact,')
             for i in range(1, len(ep_strs), 2):
                 day_type, day_sch_name = ep_strs[i].lower(), ep_strs[i + 1]
                 rule = ScheduleRule(day_schedule_dict[day_sch_name])
-                if 'alldays' in day_type:
-                    rule.apply_all = True
-                elif 'weekdays' in day_type:
-                    rule.apply_weekday = True
-                elif 'weekends' in day_type:
-                    rule.apply_weekend = True
-                elif 'sunday' in day_type:
-                    rule.apply_sunday = True
-                elif 'monday' in day_type:
-                    rule.apply_monday = True
-                elif 'tuesday' in day_type:
-                    rule.apply_tuesday = True
-                elif 'wednesday' in day_type:
-                    rule.apply_wednesday = True
-                elif 'thursday' in day_type:
-                    rule.apply_thursday = True
-                elif 'friday' in day_type:
-                    rule.apply_friday = True
-                elif 'saturday' in day_type:
-                    rule.apply_saturday = True
-                elif 'holiday' in day_type:
-                    rule.apply_holiday = True
-                elif 'allotherdays' in day_type:
-                    apply_mtx = [rul.week_apply_tuple for rul in schedule_rules]
-                    for j, dow in enumerate(zip(*apply_mtx)):
-                        if not any(dow):
-                            rule.apply_day_by_dow(j + 1)
-                    apply_hol = [rul.apply_holiday for rul in schedule_rules]
-                    if not any(apply_hol):
-                        rule.apply_holiday = True
+                day_mask = _COMPACT_DAY_MASKS.get(day_type)
+                if day_mask is None:  # day type with extra text (eg. 'For: Weekdays')
+                    day_mask = 0
+                    for day_key in _COMPACT_DAY_PATTERN.findall(day_type):
+                        day_mask |= _COMPACT_DAY_MASKS.get(day_key, 0)
+                rule._apply_mask |= day_mask
+                if 'allotherdays' in day_type:
+                    used_mask = 0
+                    for rul in schedule_rules:
+                        used_mask |= rul._apply_mask
+                    rule._apply_mask |= ~used_mask & _ALL_DAYS
                 if len(rule.days_applied) != 0:
                     schedule_rules.append(rule)
         return schedule_rules
@@ -559,26 +621,41 @@ class ScheduleRule(object):
 
     def __key(self):
         """A tuple based on the object properties, useful for hashing."""
-        return (hash(self.schedule_day), self.schedule_day, self.apply_sunday,
-                self.apply_monday, self.apply_tuesday, self.apply_wednesday,
-                self.apply_thursday, self.apply_friday, self.apply_saturday,
-                self.apply_holiday, hash(self.start_date), hash(self.end_date))
+        return (self._schedule_day, self._apply_mask, self._start_date, self._end_date)
 
     def __hash__(self):
-        return hash(self.__key())
+        h = self._hash
+        if h is None:
+            h = hash(self.__key())
+            if self._locked:  # properties cannot change; cache the hash
+                object.__setattr__(self, '_hash', h)
+        return h
 
     def __eq__(self, other):
-        return isinstance(other, ScheduleRule) and self.__key() == other.__key()
+        if not isinstance(other, ScheduleRule):
+            return False
+        # compare the inexpensive integer properties before the ScheduleDay
+        return self._apply_mask == other._apply_mask and \
+            self._start_doy == other._start_doy and self._end_doy == other._end_doy \
+            and self._start_date == other._start_date and \
+            self._end_date == other._end_date and \
+            self._schedule_day == other._schedule_day
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __copy__(self):
-        return ScheduleRule(
-            self.schedule_day.duplicate(), self.apply_sunday,
-            self.apply_monday, self.apply_tuesday, self.apply_wednesday,
-            self.apply_thursday, self.apply_friday, self.apply_saturday,
-            self.apply_holiday, self.start_date, self.end_date)
+        # the properties of this rule are already validated so __init__ is skipped
+        new_rule = ScheduleRule.__new__(ScheduleRule)
+        new_rule._locked = False
+        new_rule._hash = None
+        new_rule._schedule_day = self._schedule_day.duplicate()
+        new_rule._apply_mask = self._apply_mask
+        new_rule._start_date = self._start_date
+        new_rule._end_date = self._end_date
+        new_rule._start_doy = self._start_doy
+        new_rule._end_doy = self._end_doy
+        return new_rule
 
     def ToString(self):
         """Overwrite .NET ToString."""
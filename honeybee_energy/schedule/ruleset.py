@@ -3,7 +3,7 @@
 from __future__ import division
 
 from .day import ScheduleDay
-from .rule import ScheduleRule
+from .rule import ScheduleRule, _HOLIDAY, _ALL_DAYS
 from .typelimit import ScheduleTypeLimit
 from ..reader import parse_idf_string
 from ..writer import generate_idf_string
@@ -19,6 +19,42 @@ from ladybug.datatype.generic import GenericType
 
 import re
 import os
+from itertools import groupby
+
+# bits of the ScheduleRule apply mask for each day of the week followed by holidays
+_DAY_BITS = tuple(1 << i for i in range(8))
+
+# pattern for the IDF objects used by extract_all_from_idf_file
+_SCHEDULE_OBJ_PATTERN = re.compile(
+    r"(?i)(Schedule:Day:Interval|Schedule:Day:Hourly|Schedule:Day:List|"
+    r"Schedule:Week:Daily|Schedule:Week:Compact|ScheduleTypeLimits|"
+    r"Schedule:Year|Schedule:Constant),[\s\S]*?;")
+
+# Dates for each day of a non-leap year, indexed by the day of the year
+_DATE_BY_DOY = (None,) + tuple(Date.from_doy(doy) for doy in range(1, 366))
+
+# cache of ScheduleDay values at a timestep, keyed by the ScheduleDay properties
+_DAY_VALUES_CACHE = {}
+_DAY_VALUES_CACHE_MAX = 1000
+
+
+def _day_values_at_timestep(schedule_day, timestep):
+    """Get a tuple of ScheduleDay values at a timestep, reusing previous results.
+
+    The cache key uses the values, times and interpolate properties of the
+    ScheduleDay such that any edits to the ScheduleDay result in a new key and
+    ScheduleDays with matching properties share the same result.
+    """
+    key = (schedule_day._values, schedule_day._times, schedule_day._interpolate,
+           timestep)
+    try:
+        return _DAY_VALUES_CACHE[key]
+    except KeyError:
+        values = tuple(schedule_day.values_at_timestep(timestep))
+        if len(_DAY_VALUES_CACHE) >= _DAY_VALUES_CACHE_MAX:
+            _DAY_VALUES_CACHE.clear()
+        _DAY_VALUES_CACHE[key] = values
+        return values
 
 
 @lockable
@@ -38,9 +74,11 @@ class ScheduleRuleset(object):
     """
     __slots__ = ('_name', '_default_day_schedule', '_summer_designday_schedule',
                  '_winter_designday_schedule', '_schedule_rules',
-                 '_schedule_type_limit', '_locked')
+                 '_schedule_type_limit', '_hash', '_locked')
     _dow_text_to_int = {'sunday': 1, 'monday': 2, 'tuesday': 3, 'wednesday': 4,
-                        'thursday': 2, 'friday': 3, 'saturday': 7}
+                        'thursday': 5, 'friday': 6, 'saturday': 7,
+                        'Sunday': 1, 'Monday': 2, 'Tuesday': 3, 'Wednesday': 4,
+                        'Thursday': 5, 'Friday': 6, 'Saturday': 7}
     _schedule_week_comments = (
         'name', 'sunday', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday',
         'saturday', 'holiday', 'summer design day', 'winter design day',
@@ -68,6 +106,7 @@ class ScheduleRuleset(object):
                 the winter design day (used to size the heating system).
         """
         self._locked = False  # unlocked by default
+        self._hash = None  # hash is only cached while the object is locked
         self.name = name
         self.default_day_schedule = default_day_schedule
         self.schedule_rules = schedule_rules
@@ -171,27 +210,34 @@ class ScheduleRuleset(object):
             day_scheds.append(self._summer_designday_schedule)
         if self._winter_designday_schedule is not None:
             day_scheds.append(self._winter_designday_schedule)
-        for rule in self.schedule_rules:
+        for rule in self._schedule_rules:
             day_scheds.append(rule._schedule_day)
-        return list(set(day_scheds))  # Since I disabled _check_schedule_parent, I need to remove duplicate
+        # skip repeated objects and only compare distinct days that share a name
+        unique_days, day_ids, day_names = [], set(), {}
+        for day in day_scheds:
+            if id(day) in day_ids:
+                continue
+            day_ids.add(id(day))
+            same_name = day_names.setdefault(day._name, [])
+            if not any(d == day for d in same_name):
+                same_name.append(day)
+                unique_days.append(day)
+        return unique_days
 
     @property
     def is_constant(self):
         """Boolean noting whether the schedule is representable with a single value."""
-        return self.default_day_schedule.is_constant and self._schedule_rules == [] and \
+        return not self._schedule_rules and \
             self._summer_designday_schedule is None and \
-            self._winter_designday_schedule is None
+            self._winter_designday_schedule is None and \
+            self._default_day_schedule.is_constant
 
     @property
     def is_single_week(self):
         """Boolean noting whether this schedule is representable with one week schedule.
         """
-        if self._schedule_rules == []:
-            return True
-        elif all([sch._start_doy == 1 and sch._end_doy == 365
-                  for sch in self._schedule_rules]):
-            return True
-        return False
+        return all(sch._start_doy == 1 and sch._end_doy == 365
+                   for sch in self._schedule_rules)
 
     def add_rule(self, rule):
         """Add a ScheduleRule to this ScheduleRuleset.
@@ -254,9 +300,10 @@ class ScheduleRuleset(object):
                 leap year (True) or a non-leap year (False). Default: False.
         """
         # get the values over the day for each of the ScheduleDay objects
-        sch_day_vals = [rule.schedule_day.values_at_timestep(timestep)
+        sch_day_vals = [_day_values_at_timestep(rule.schedule_day, timestep)
                         for rule in self._schedule_rules]
-        sch_day_vals.append(self.default_day_schedule.values_at_timestep(timestep))
+        sch_day_vals.append(
+            _day_values_at_timestep(self.default_day_schedule, timestep))
         # ensure that everything is consistent across leap years
         if start_date.leap_year is not leap_year:
             start_date = Date(start_date.month, start_date.day, leap_year)
@@ -265,6 +312,12 @@ class ScheduleRuleset(object):
         # ensure start date is before end date
         assert start_date <= end_date, 'ScheduleRuleset values() start_date must come ' \
             'before end_date. {} comes after {}.'.format(start_date, end_date)
+        # process the start_dow into an integer.
+        dow = self._dow_text_to_int.get(start_dow) or \
+            self._dow_text_to_int[start_dow.lower()]
+        # if there are no rules, the default_day_schedule applies on every day
+        if len(self._schedule_rules) == 0:
+            return list(sch_day_vals[-1]) * (end_date.doy - start_date.doy + 1)
         # process the holidays if they are input
         if holidays is not None:
             hol_doy = []
@@ -274,8 +327,6 @@ class ScheduleRuleset(object):
                 hol_doy.append(hol.doy)
         else:
             hol_doy = []
-        # process the start_dow into an integer.
-        dow = self._dow_text_to_int[start_dow.lower()]
         # generate the full list of annual values
         if not leap_year:
             return self._get_sch_values(
@@ -392,26 +443,24 @@ class ScheduleRuleset(object):
         """
         # process the rules for the days of the week and holidays
         schedule_rules = []
-        applied_day_values = []
+        applied_day_indices = {}  # tuple of day values mapped to index of rule
+        avg_day_vals = []
         all_vals = (sunday_values, monday_values, tuesday_values, wednesday_values,
                     thursday_values, friday_values, saturday_values, holiday_values)
         for i, day_vals in enumerate(all_vals):
-            if day_vals not in applied_day_values:  # make a new ScheduleDay and rule
+            day_key = tuple(day_vals)
+            try:  # edit one of the existing rules to apply it to the new day
+                rule = schedule_rules[applied_day_indices[day_key]]
+            except KeyError:  # make a new ScheduleDay and rule
                 d_name = '{}_{}'.format(name, cls._schedule_week_comments[i + 1].title())
                 sch_day = ScheduleDay.from_values_at_timestep(d_name, day_vals, timestep)
                 rule = ScheduleRule(sch_day)
-                rule.apply_day_by_dow(i + 1)
+                applied_day_indices[day_key] = len(schedule_rules)
                 schedule_rules.append(rule)
-                applied_day_values.append(day_vals)
-            else:  # edit one of the existing rules to apply it to the new day
-                for count, sch in enumerate(applied_day_values):
-                    if day_vals == sch:
-                        sch_rule_index = count
-                rule = schedule_rules[sch_rule_index]
-                rule.apply_day_by_dow(i + 1)
+                avg_day_vals.append(sum(day_vals) / len(day_vals))
+            rule.apply_day_by_dow(i + 1)
 
         # get ScheduleDay for summer and winter design days
-        avg_day_vals = [sum(vals) / len(vals) for vals in applied_day_values]
         if summer_designday_values is None:
             sch_i = avg_day_vals.index(max(avg_day_vals))
             summer = schedule_rules[sch_i]._schedule_day.duplicate()
@@ -422,7 +471,7 @@ class ScheduleRuleset(object):
         if winter_designday_values is None:
             sch_i = avg_day_vals.index(min(avg_day_vals))
             winter = schedule_rules[sch_i]._schedule_day.duplicate()
-            summer.name = '{}_WntrDsn'.format(summer.name)
+            winter.name = '{}_WntrDsn'.format(winter.name)
         else:
             winter = ScheduleDay.from_values_at_timestep(
                 '{}_WntrDsn'.format(name), winter_designday_values, timestep)
@@ -456,20 +505,18 @@ class ScheduleRuleset(object):
                 units to the schedule values.
         """
         schedule_rules = []
-        applied_day_names = []
+        applied_day_names = {}  # name of ScheduleDay mapped to index of rule
         all_sched = (sunday_schedule, monday_schedule, tuesday_schedule,
                      wednesday_schedule, thursday_schedule, friday_schedule,
                      saturday_schedule, holiday_schedule)
         for i, day_sch in enumerate(all_sched):
-            if day_sch.name not in applied_day_names:  # make a new rule
+            try:  # edit one of the existing rules to apply it to the new day
+                rule = schedule_rules[applied_day_names[day_sch.name]]
+            except KeyError:  # make a new rule
                 rule = ScheduleRule(day_sch)
-                rule.apply_day_by_dow(i + 1)
+                applied_day_names[day_sch.name] = len(schedule_rules)
                 schedule_rules.append(rule)
-                applied_day_names.append(day_sch.name)
-            else:  # edit one of the existing rules to apply it to the new day
-                sch_rule_index = applied_day_names.index(day_sch.name)
-                rule = schedule_rules[sch_rule_index]
-                rule.apply_day_by_dow(i + 1)
+            rule.apply_day_by_dow(i + 1)
         if summer_designday_schedule.name in applied_day_names:  # avoid duplicate
             summer_designday_schedule = summer_designday_schedule.duplicate()
             summer_designday_schedule.name = \
@@ -498,6 +545,8 @@ class ScheduleRuleset(object):
                 If None, the resulting schedule will have no ScheduleTypeLimit.
         """
         # process the schedule components
+        day_idf_strings = [sch_str.strip() for sch_str in day_idf_strings]
+        week_idf_strings = [sch_str.strip() for sch_str in week_idf_strings]
         day_schedule_dict = cls._idf_day_schedule_dictionary(day_idf_strings)
         week_sch_dict, week_dd_dict = cls._idf_week_schedule_dictionary(
             week_idf_strings, day_schedule_dict)
@@ -509,15 +558,17 @@ class ScheduleRuleset(object):
         all_rules = []
         for i in range(2, len(year_sch), 5):
             rules = week_sch_dict[year_sch[i]]
-            st_date = Date(int(year_sch[i + 1]), int(year_sch[i + 2]))
-            end_date = Date(int(year_sch[i + 3]), int(year_sch[i + 4]))
+            st_mon, st_day, end_mon, end_day = [int(v) for v in year_sch[i + 1:i + 5]]
+            st_date = Date(st_mon, st_day)
+            end_date = Date(end_mon, end_day)
             for rule in rules:
                 rule.start_date = st_date
                 rule.end_date = end_date
             all_rules.extend(rules)
         default_day_schedule = all_rules[0].schedule_day
         summer_dd_sch, winter_dd_sch = week_dd_dict[year_sch[2]]
-        sched = cls(year_sch[0], default_day_schedule, all_rules[1:], schedule_type)
+        sched = cls._from_trusted(
+            year_sch[0], default_day_schedule, all_rules[1:], schedule_type)
         cls._apply_designdays_with_check(sched, summer_dd_sch, winter_dd_sch)
         return sched
 
@@ -547,23 +598,21 @@ class ScheduleRuleset(object):
             'Expected ScheduleRuleset. Got {}.'.format(data['type'])
 
         default_sched = ScheduleDay.from_dict(data['default_day_schedule'])
-        rules = None
-        if 'schedule_rules' in data and data['schedule_rules'] is not None:
-            rules = [ScheduleRule.from_dict(rule) for rule in data['schedule_rules']]
-        sched_type = None
-        if 'schedule_type_limit' in data and data['schedule_type_limit'] is not None:
-            sched_type = ScheduleTypeLimit.from_dict(data['schedule_type_limit'])
-        summer_sched = None
-        if 'summer_designday_schedule' in data and \
-                data['summer_designday_schedule'] is not None:
-            summer_sched = ScheduleDay.from_dict(data['summer_designday_schedule'])
-        winter_sched = None
-        if 'winter_designday_schedule' in data and \
-                data['winter_designday_schedule'] is not None:
-            winter_sched = ScheduleDay.from_dict(data['winter_designday_schedule'])
-
-        return cls(data['name'], default_sched, rules, sched_type,
-                   summer_sched, winter_sched)
+        rules = data.get('schedule_rules')
+        if rules is not None:
+            rules = [ScheduleRule.from_dict(rule) for rule in rules]
+        sched_type = data.get('schedule_type_limit')
+        if sched_type is not None:
+            sched_type = ScheduleTypeLimit.from_dict(sched_type)
+        summer_sched = data.get('summer_designday_schedule')
+        if summer_sched is not None:
+            summer_sched = ScheduleDay.from_dict(summer_sched)
+        winter_sched = data.get('winter_designday_schedule')
+        if winter_sched is not None:
+            winter_sched = ScheduleDay.from_dict(winter_sched)
+
+        return cls._from_trusted(data['name'], default_sched, rules, sched_type,
+                                 summer_sched, winter_sched)
 
     def to_rules(self, start_date, end_date):
         """Get all of rules needed to implement this ScheduleRuleset over a date range.
@@ -600,18 +649,10 @@ class ScheduleRuleset(object):
         # add the default_day_schedule for all days not covered by rules
         default_rule = ScheduleRule(self.default_day_schedule.duplicate(),
                                     start_date=start_date, end_date=end_date)
-        for dow in range(7):
-            for rule in rules:
-                if rule.week_apply_tuple[dow]:
-                    break
-            else:  # no rule applies; use default_day_schedule.
-                default_rule.apply_day_by_dow(dow + 1)
-        # check rules that apply on holidays
-        for rule in rules:  # see if rules apply
-            if rule.apply_holiday:
-                break
-        else:  # no rule applies; use default_day_schedule.
-            default_rule.apply_holiday = True
+        applied_mask = 0  # days of the week and holidays covered by the rules
+        for rule in rules:
+            applied_mask |= rule._apply_mask
+        default_rule._apply_mask = _ALL_DAYS & ~applied_mask
         rules.append(default_rule)
 
         return rules
@@ -664,46 +705,49 @@ class ScheduleRuleset(object):
                 self._idf_week_schedule_from_rule_indices(range(len(self)), 1)
             week_schedules.append(wk_sch)
             yr_wk_s_names = [wk_sch_name]
-            yr_wk_dt_range = [[Date(1, 1), Date(12, 31)]]
+            yr_wk_dt_range = [[_DATE_BY_DOY[1], _DATE_BY_DOY[365]]]
         else:  # create a set of week schedules throughout the year
-            # loop through 365 days of the year to find unique combinations of rules
-            rules_each_day = []
-            for doy in range(1, 366):
-                rules_on_doy = tuple(i for i, rule in enumerate(self._schedule_rules)
-                                     if rule._start_doy <= doy <= rule._end_doy)
-                rules_each_day.append(rules_on_doy)
-            unique_rule_sets = set(rules_each_day)
+            # get runs of consecutive days of the year that use the same rules
+            if len(self._schedule_rules) == 1:  # the runs follow from the dates
+                rule = self._schedule_rules[0]
+                rule_runs = [((), 1, rule._start_doy - 1),
+                             ((0,), rule._start_doy, rule._end_doy),
+                             ((), rule._end_doy + 1, 365)]
+                rule_runs = [run for run in rule_runs if run[1] <= run[2]]
+            else:
+                rule_runs = []
+                doy = 1
+                for rule_set, days in groupby(
+                        self._rules_each_day(self._schedule_rules)):
+                    end_doy = doy + len(tuple(days)) - 1
+                    rule_runs.append((rule_set, doy, end_doy))
+                    doy = end_doy + 1
+            unique_rule_sets = set(run[0] for run in rule_runs)
             # check if any combination yield the same week schedule and remove duplicates
-            week_tuples = [tuple(self._get_week_list(rule_set))
-                           for rule_set in unique_rule_sets]
-            unique_week_tuples = list(set(week_tuples))
+            week_cache = {}  # map each unique rule index set to its week schedule
+            for rule_set in unique_rule_sets:
+                week_cache[rule_set] = tuple(self._get_week_list(rule_set))
+            unique_week_tuples = list(set(week_cache.values()))
             # create the unique week schedules from the combinations of rules
-            week_sched_names = []
+            week_sched_names = {}  # map each unique week list to its schedule name
             for i, week_list in enumerate(unique_week_tuples):
                 wk_schedule, wk_sch_name = \
                     self._idf_week_schedule_from_week_list(week_list, i + 1)
                 week_schedules.append(wk_schedule)
-                week_sched_names.append(wk_sch_name)
+                week_sched_names[week_list] = wk_sch_name
             # create a disctionary mapping unique rule index lists to week schedule names
             rule_set_map = {}
-            for rule_i, week_list in zip(unique_rule_sets, week_tuples):
-                unique_week_i = unique_week_tuples.index(week_list)
-                rule_set_map[rule_i] = week_sched_names[unique_week_i]
-            # loop through all 365 days of the year to find when rules change
+            for rule_i, week_list in week_cache.items():
+                rule_set_map[rule_i] = week_sched_names[week_list]
+            # merge the runs of days into date ranges that use the same week schedule
             yr_wk_s_names = []
             yr_wk_dt_range = []
-            prev_week_sched = None
-            for doy in range(1, 366):
-                week_sched = rule_set_map[rules_each_day[doy - 1]]
-                if week_sched != prev_week_sched:  # change to a new rule set
-                    yr_wk_s_names.append(week_sched)
-                    if doy != 1:
-                        yr_wk_dt_range[-1].append(Date.from_doy(doy - 1))
-                        yr_wk_dt_range.append([Date.from_doy(doy)])
-                    else:
-                        yr_wk_dt_range.append([Date(1, 1)])
-                    prev_week_sched = week_sched
-            yr_wk_dt_range[-1].append(Date(12, 31))
+            for week_sched, runs in groupby(
+                    rule_runs, key=lambda run: rule_set_map[run[0]]):
+                runs = tuple(runs)
+                yr_wk_s_names.append(week_sched)
+                yr_wk_dt_range.append(
+                    [_DATE_BY_DOY[runs[0][1]], _DATE_BY_DOY[runs[-1][2]]])
 
         # create the year fields and comments
         for i, (wk_sch_name, dt_range) in enumerate(zip(yr_wk_s_names, yr_wk_dt_range)):
@@ -766,6 +810,7 @@ class ScheduleRuleset(object):
     def unlock(self):
         """The unlock() method also unlocks the ScheduleDay and ScheduleRule objects."""
         self._locked = False
+        self._hash = None
         self._default_day_schedule.unlock()
         if self._summer_designday_schedule is not None:
             self._summer_designday_schedule.unlock()
@@ -791,31 +836,32 @@ class ScheduleRuleset(object):
         assert os.path.isfile(idf_file), 'Cannot find an idf file at {}'.format(idf_file)
         with open(idf_file, 'r') as ep_file:
             file_contents = ep_file.read()
+        # sort all of the schedule objects in the file by their type
+        idf_objs = {
+            'schedule:day:interval': [], 'schedule:day:hourly': [],
+            'schedule:day:list': [], 'schedule:week:daily': [],
+            'schedule:week:compact': [], 'scheduletypelimits': [],
+            'schedule:year': [], 'schedule:constant': []}
+        for obj_match in _SCHEDULE_OBJ_PATTERN.finditer(file_contents):
+            idf_objs[obj_match.group(1).lower()].append(obj_match.group(0))
         # extract all of the ScheduleDay objects
-        day_pattern1 = re.compile(r"(?i)(Schedule:Day:Interval,[\s\S]*?;)")
-        day_pattern2 = re.compile(r"(?i)(Schedule:Day:Hourly,[\s\S]*?;)")
-        day_pattern3 = re.compile(r"(?i)(Schedule:Day:List,[\s\S]*?;)")
-        day_sch_str = day_pattern1.findall(file_contents) + \
-            day_pattern2.findall(file_contents) + day_pattern3.findall(file_contents)
+        day_sch_str = idf_objs['schedule:day:interval'] + \
+            idf_objs['schedule:day:hourly'] + idf_objs['schedule:day:list']
         day_schedule_dict = ScheduleRuleset._idf_day_schedule_dictionary(day_sch_str)
         # extract all of the Schedule:Week objects
-        week_pattern_1 = re.compile(r"(?i)(Schedule:Week:Daily,[\s\S]*?;)")
-        week_pattern_2 = re.compile(r"(?i)(Schedule:Week:Compact,[\s\S]*?;)")
-        week_sch_str = week_pattern_1.findall(file_contents) + week_pattern_2.findall(file_contents)
+        week_sch_str = idf_objs['schedule:week:daily'] + \
+            idf_objs['schedule:week:compact']
         week_sch_dict, week_dd_dict = ScheduleRuleset._idf_week_schedule_dictionary(
             week_sch_str, day_schedule_dict)
         # extract all of the ScheduleTypeLimit objects
-        type_pattern = re.compile(r"(?i)(ScheduleTypeLimits,[\s\S]*?;)")
-        sch_type_str = type_pattern.findall(file_contents)
-        sch_type_dict = ScheduleRuleset._idf_schedule_type_dictionary(sch_type_str)
+        sch_type_dict = ScheduleRuleset._idf_schedule_type_dictionary(
+            idf_objs['scheduletypelimits'])
         # extract all of the Schedule:Year objects and convert to ScheduleRuleset
-        year_pattern = re.compile(r"(?i)(Schedule:Year,[\s\S]*?;)")
         year_props = tuple(parse_idf_string(idf_string) for
-                           idf_string in year_pattern.findall(file_contents))
+                           idf_string in idf_objs['schedule:year'])
         # extract all of the Schedule:Constant objects and convert to ScheduleRuleset
-        constant_pattern = re.compile(r"(?i)(Schedule:Constant,[\s\S]*?;)")
         constant_props = tuple(parse_idf_string(idf_string) for
-                               idf_string in constant_pattern.findall(file_contents))
+                               idf_string in idf_objs['schedule:constant'])
         # compile all of the ScheduleRuleset objects from extracted properties
         schedules = []
         for year_sch in year_props:
@@ -874,20 +920,15 @@ class ScheduleRuleset(object):
                 'Got {}.'.format(sum(weights))
 
         # if all input shcedules are single week, the averaging process is a lot simpler
-        if all([sched.is_single_week for sched in schedules]):
+        if all(sched.is_single_week for sched in schedules):
             rule_indices = [range(len(sched)) for sched in schedules]
             return ScheduleRuleset._get_avg_week(name, schedules, weights, timestep_resolution,
                                                  rule_indices)
         else:
-            # loop through 365 days of the year to find unique combinations of rules
-            rules_each_day = []
-            for doy in range(1, 366):
-                rules_on_doy = tuple(tuple(
-                    i for i, rule in enumerate(sched._schedule_rules)
-                    if rule._start_doy <= doy <= rule._end_doy)
-                    for sched in schedules)
-                rules_each_day.append(rules_on_doy)
-            unique_rule_sets = set(rules_each_day)
+            # get the rules applied on each day of the year to find unique combinations
+            rules_each_day = list(zip(*[ScheduleRuleset._rules_each_day(
+                sched._schedule_rules) for sched in schedules]))
+            unique_rule_sets = list(set(rules_each_day))
             # create the average week schedules from the unique combinations of rules
             week_schedules = []
             for i, rule_indices in enumerate(unique_rule_sets):
@@ -896,24 +937,16 @@ class ScheduleRuleset(object):
                                                            timestep_resolution, rule_indices)
                 week_schedules.append(week_sched)
             # create a disctionary mapping unique rule index lists to average week schedules
-            rule_set_map = {}
-            for rule_i, week_sched in zip(unique_rule_sets, week_schedules):
-                rule_set_map[rule_i] = week_sched
-            # loop through all 365 days of the year to find when rules change
+            rule_set_map = dict(zip(unique_rule_sets, week_schedules))
+            # group the days of the year into runs that use the same rules
             yr_wk_scheds = []
             yr_wk_dt_range = []
-            prev_week_rules = None
-            for doy in range(1, 366):
-                week_rules = rules_each_day[doy - 1]
-                if week_rules != prev_week_rules:  # change to a new rule set
-                    yr_wk_scheds.append(rule_set_map[week_rules])
-                    if doy != 1:
-                        yr_wk_dt_range[-1].append(Date.from_doy(doy - 1))
-                        yr_wk_dt_range.append([Date.from_doy(doy)])
-                    else:
-                        yr_wk_dt_range.append([Date(1, 1)])
-                    prev_week_rules = week_rules
-            yr_wk_dt_range[-1].append(Date(12, 31))
+            doy = 1
+            for week_rules, days in groupby(rules_each_day):
+                end_doy = doy + len(tuple(days)) - 1
+                yr_wk_scheds.append(rule_set_map[week_rules])
+                yr_wk_dt_range.append([_DATE_BY_DOY[doy], _DATE_BY_DOY[end_doy]])
+                doy = end_doy + 1
 
             # convert week ScheduleRulesets to_rules and assign start + end dates
             final_rules = []
@@ -930,68 +963,138 @@ class ScheduleRuleset(object):
 
     def _get_sch_values(self, sch_day_vals, dow, start_date, end_date, hol_doy):
         """Get a list of values over a date range for a typical year."""
-        values = []
-        for doy in range(start_date.doy, end_date.doy + 1):
-            if dow > 7:  # reset the day of the week to sunday
-                dow = 1
-            if doy in hol_doy:
-                for i, rule in enumerate(self._schedule_rules):  # see if rules apply
-                    if rule.apply_holiday and rule.does_rule_apply_doy(doy):
-                        values.extend(sch_day_vals[i])
-                        break
-                else:  # no rule applies; use default_day_schedule.
-                    values.extend(sch_day_vals[-1])
-            else:
-                for i, rule in enumerate(self._schedule_rules):  # see if rules apply
-                    if rule.does_rule_apply(doy, dow):
-                        values.extend(sch_day_vals[i])
-                        break
-                else:  # no rule applies; use default_day_schedule.
-                    values.extend(sch_day_vals[-1])
-            dow += 1
-        return values
+        rule_props = [(rule._start_doy, rule._end_doy, rule._apply_mask)
+                      for rule in self._schedule_rules]
+        return self._values_from_rule_props(
+            rule_props, sch_day_vals, dow, start_date.doy, end_date.doy, hol_doy)
 
     def _get_sch_values_leap_year(self, sch_day_vals, dow,
                                   start_date, end_date, hol_doy):
         """Get a list of values over a date range for a leap year."""
+        rule_props = []
+        for rule in self._schedule_rules:
+            st_doy = rule._start_doy if rule._start_date.month <= 2 \
+                else rule._start_doy + 1
+            end_doy = rule._end_doy if rule._end_date.month <= 2 \
+                else rule._end_doy + 1
+            rule_props.append((st_doy, end_doy, rule._apply_mask))
+        return self._values_from_rule_props(
+            rule_props, sch_day_vals, dow, start_date.doy, end_date.doy, hol_doy)
+
+    @staticmethod
+    def _values_from_rule_props(rule_props, sch_day_vals, dow, st_doy, end_doy,
+                                hol_doy):
+        """Get a list of values over a range of days from the properties of rules.
+
+        Rather than testing each rule on every day, the days to which each rule
+        applies are packed into the bits of an integer (with bit 0 as st_doy).
+        Rules are processed in order of priority and each rule only claims the
+        days that have not been claimed by a higher priority rule.
+
+        Args:
+            rule_props: A list of (start_doy, end_doy, apply_mask) tuples for each
+                rule of the schedule, which are in order of priority.
+            sch_day_vals: A list of values over the day for each rule, followed by
+                the values of the default_day_schedule.
+            dow: An integer for the day of the week on the st_doy.
+            st_doy: An integer for the day of the year to start the values.
+            end_doy: An integer for the day of the year to end the values.
+            hol_doy: A list of integers for the days of the year that are holidays.
+        """
+        # get the bits of the holidays and of each day of the week over the range
+        day_count = end_doy - st_doy + 1
+        all_bits = (1 << day_count) - 1
+        hol_bits = 0
+        for doy in hol_doy:
+            if st_doy <= doy <= end_doy:
+                hol_bits |= 1 << (doy - st_doy)
+        week_bits = 0
+        for i in range(0, day_count, 7):
+            week_bits |= 1 << i
+        dow_bits = [((week_bits << ((d - dow + 1) % 7)) & all_bits) & ~hol_bits
+                    for d in range(7)]
+        mask_bits = {}  # bits of the days applied for each apply mask
+
+        # claim the days of each rule in order of priority
+        day_sch_i = [len(sch_day_vals) - 1] * day_count
+        claimed_bits = 0
+        for i, (rule_st, rule_end, mask) in enumerate(rule_props):
+            rule_st, rule_end = max(rule_st, st_doy), min(rule_end, end_doy)
+            if rule_st > rule_end:
+                continue
+            try:
+                rule_bits = mask_bits[mask]
+            except KeyError:
+                rule_bits = hol_bits if mask & _HOLIDAY else 0
+                for d in range(7):
+                    if mask & (1 << d):
+                        rule_bits |= dow_bits[d]
+                mask_bits[mask] = rule_bits
+            rule_bits &= ((1 << (rule_end - rule_st + 1)) - 1) << (rule_st - st_doy)
+            rule_bits &= ~claimed_bits
+            claimed_bits |= rule_bits
+            while rule_bits:  # assign the ScheduleDay to each newly claimed day
+                low_bit = rule_bits & -rule_bits
+                day_sch_i[low_bit.bit_length() - 1] = i
+                rule_bits ^= low_bit
+            if claimed_bits == all_bits:
+                break
+
+        # generate the values from runs of consecutive days with the same ScheduleDay
         values = []
-        for doy in range(start_date.doy, end_date.doy + 1):
-            if dow > 7:  # reset the day of the week to sunday
-                dow = 1
-            if doy in hol_doy:
-                for i, rule in enumerate(self._schedule_rules):  # see if rules apply
-                    if rule.apply_holiday and rule.does_rule_apply_doy_leap_year(doy):
-                        values.extend(sch_day_vals[i])
-                        break
-                else:  # no rule applies; use default_day_schedule.
-                    values.extend(sch_day_vals[-1])
-            else:
-                for i, rule in enumerate(self._schedule_rules):  # see if rules apply
-                    if rule.does_rule_apply_leap_year(doy, dow):
-                        values.extend(sch_day_vals[i])
-                        break
-                else:  # no rule applies; use default_day_schedule.
-                    values.extend(sch_day_vals[-1])
-            dow += 1
+        for i, run in groupby(day_sch_i):
+            values.extend(sch_day_vals[i] * len(tuple(run)))
         return values
 
+    @staticmethod
+    def _rules_each_day(schedule_rules):
+        """Get a list of 365 tuples with the indices of the rules active on each day.
+
+        The set of active rules can only change on a day where a rule starts or
+        the day after one ends. So the active rules are only evaluated at these
+        boundaries and the same tuple is reused for all days up to the next one.
+
+        Args:
+            schedule_rules: A list of ScheduleRules to be evaluated.
+        """
+        rule_spans = [(rule._start_doy, rule._end_doy) for rule in schedule_rules]
+        boundaries = set([1])
+        for st_doy, end_doy in rule_spans:
+            boundaries.add(st_doy)
+            boundaries.add(end_doy + 1)
+        boundaries = sorted(doy for doy in boundaries if doy <= 365)
+        boundaries.append(366)
+        active_rules = []
+        for st_doy, next_doy in zip(boundaries[:-1], boundaries[1:]):
+            day_rules = tuple(i for i, (st, end) in enumerate(rule_spans)
+                              if st <= st_doy <= end)
+            active_rules.extend([day_rules] * (next_doy - st_doy))
+        return active_rules
+
     def _get_week_list(self, rule_indices):
         """Get a list of the ScheduleDay names applied on each day of the week."""
-        week_list = []
-        for dow in range(7):
-            for i in rule_indices:
-                if self._schedule_rules[i].week_apply_tuple[dow]:
-                    week_list.append(self._schedule_rules[i].schedule_day.name)
+        sch_rules = self._schedule_rules
+        default_name = self._default_day_schedule.name
+        # the first rule that applies on each day of the week wins
+        week_list = [default_name] * 7
+        unclaimed = _ALL_DAYS & ~_HOLIDAY
+        for i in rule_indices:
+            mask = sch_rules[i]._apply_mask & unclaimed
+            if mask:
+                day_name = sch_rules[i]._schedule_day.name
+                for dow in range(7):
+                    if mask & (1 << dow):
+                        week_list[dow] = day_name
+                unclaimed &= ~mask
+                if not unclaimed:
                     break
-            else:  # no rule applies; use default_day_schedule.
-                week_list.append(self.default_day_schedule.name)
         # check rules that apply on holidays
-        for i, rule in enumerate(self._schedule_rules):  # see if rules apply
-            if rule.apply_holiday:
-                week_list.append(self._schedule_rules[i].schedule_day.name)
+        for rule in sch_rules:  # see if rules apply
+            if rule._apply_mask & _HOLIDAY:
+                week_list.append(rule._schedule_day.name)
                 break
         else:  # no rule applies; use default_day_schedule.
-            week_list.append(self.default_day_schedule.name)
+            week_list.append(default_name)
         return week_list
 
     def _get_extra_week_fields(self):
@@ -1025,6 +1128,28 @@ class ScheduleRuleset(object):
             'Schedule:Week:Daily', week_fields, self._schedule_week_comments)
         return week_schedule, week_sch_name
 
+    @classmethod
+    def _from_trusted(cls, name, default_day_schedule, schedule_rules=None,
+                      schedule_type_limit=None, summer_designday_schedule=None,
+                      winter_designday_schedule=None):
+        """Create a ScheduleRuleset without checking the type of each input object.
+
+        This should only be used when all of the ScheduleDays, ScheduleRules and
+        the ScheduleTypeLimit have just been created by their own classmethods
+        (eg. from_dict), meaning that they are already known to be valid. The name
+        is still checked since it comes directly from the input.
+        """
+        sched = cls.__new__(cls)
+        sched._locked = False
+        sched._hash = None
+        sched.name = name
+        sched._default_day_schedule = default_day_schedule
+        sched._schedule_rules = schedule_rules if schedule_rules is not None else []
+        sched._schedule_type_limit = schedule_type_limit
+        sched._summer_designday_schedule = summer_designday_schedule
+        sched._winter_designday_schedule = winter_designday_schedule
+        return sched
+
     def _check_schedule_parent(self, schedule, sch_type='child'):
         """Check that a ScheduleDay has only one parent."""
         # if schedule._parent is not None:
@@ -1077,7 +1202,6 @@ class ScheduleRuleset(object):
         """Get a dictionary of DaySchedule objects from an IDF string list."""
         day_schedule_dict = {}
         for sch_str in day_idf_strings:
-            sch_str = sch_str.strip()
             sch_obj = ScheduleDay.from_idf(sch_str)
             day_schedule_dict[sch_obj.name] = sch_obj
         return day_schedule_dict
@@ -1088,14 +1212,15 @@ class ScheduleRuleset(object):
         week_schedule_dict = {}
         week_designday_dict = {}
         for sch_str in week_idf_strings:
-            sch_str = sch_str.strip()
-            rules = ScheduleRule.extract_all_from_schedule_week(sch_str, day_sch_dict)
-            if sch_str.startswith('Schedule:Week:Daily,'):
-                ep_strs = parse_idf_string(sch_str)
+            is_daily = sch_str.startswith('Schedule:Week:Daily,')
+            ep_strs = parse_idf_string(sch_str) if is_daily else \
+                parse_idf_string(sch_str, 'Schedule:Week:Compact,')
+            rules = ScheduleRule._extract_all_from_week_fields(
+                ep_strs, is_daily, day_sch_dict)
+            if is_daily:
                 summer_dd = day_sch_dict[ep_strs[9]]
                 winter_dd = day_sch_dict[ep_strs[10]]
             else:
-                ep_strs = parse_idf_string(sch_str, 'Schedule:Week:Compact,')
                 summer_dd = winter_dd = rules[-1].schedule_day
                 for i in range(1, len(ep_strs), 2):
                     day_type, day_sch_name = ep_strs[i].lower(), ep_strs[i + 1]
@@ -1114,7 +1239,6 @@ class ScheduleRuleset(object):
         """
         sch_type_dict = {}
         for type_str in type_idf_strings:
-            type_str = type_str.strip()
             type_obj = ScheduleTypeLimit.from_idf(type_str)
             sch_type_dict[type_obj.name] = type_obj
         return sch_type_dict
@@ -1125,21 +1249,16 @@ class ScheduleRuleset(object):
         # get matrix with each ruleset schedule in rows and each day of week in cols
         val_mtx = []
         for s_i, sched in enumerate(schedules):
+            rule_masks = [(sched[i]._apply_mask, sched[i]._schedule_day)
+                          for i in rule_indices[s_i]]
             week_list = []
-            for dow in range(7):
-                for i in rule_indices[s_i]:  # see if rules apply
-                    if sched[i].week_apply_tuple[dow]:
-                        week_list.append(sched[i].schedule_day)
+            for day_bit in _DAY_BITS:  # days of the week followed by holidays
+                for mask, sch_day in rule_masks:  # see if rules apply
+                    if mask & day_bit:
+                        week_list.append(sch_day)
                         break
                 else:  # no rule applies; use default_day_schedule.
                     week_list.append(sched.default_day_schedule)
-            # check rules that apply on holidays
-            for i in rule_indices[s_i]:  # see if rules apply
-                if sched[i].apply_holiday:
-                    week_list.append(sched[i].schedule_day)
-                    break
-            else:  # no rule applies; use default_day_schedule.
-                week_list.append(sched.default_day_schedule)
             # check the rules applied for summer and winter design days
             summer = sched.default_day_schedule if sched._summer_designday_schedule \
                 is None else sched._summer_designday_schedule
@@ -1148,12 +1267,12 @@ class ScheduleRuleset(object):
                 is None else sched._winter_designday_schedule
             week_list.append(winter)
             # add all values to the matrix
-            val_mtx.append([day_sch.values_at_timestep(timestep_resolution)
+            val_mtx.append([_day_values_at_timestep(day_sch, timestep_resolution)
                             for day_sch in week_list])
         # transpose the matrix and compute weighted average values for each dow
         avg_mtx = []
         for dow_list in zip(*val_mtx):
-            sch_vals = [sum([val * weights[i] for i, val in enumerate(values)])
+            sch_vals = [sum(val * wgt for val, wgt in zip(values, weights))
                         for values in zip(*dow_list)]
             avg_mtx.append(sch_vals)
         # create the final ScheduleRuleset from the values
@@ -1176,10 +1295,15 @@ class ScheduleRuleset(object):
         return (self.name, hash(self.default_day_schedule),
                 hash(self.summer_designday_schedule),
                 hash(self.winter_designday_schedule), hash(self.schedule_type_limit)) + \
-            tuple(hash(rule) for rule in self.schedule_rules)
+            tuple(hash(rule) for rule in self._schedule_rules)
 
     def __hash__(self):
-        return hash(self.__key())
+        h = self._hash
+        if h is None:
+            h = hash(self.__key())
+            if self._locked:  # properties cannot change; cache the hash
+                object.__setattr__(self, '_hash', h)
+        return h
 
     def __eq__(self, other):
         return isinstance(other, ScheduleRuleset) and self.__key() == other.__key()
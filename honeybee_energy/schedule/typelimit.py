@@ -5,13 +5,15 @@ from __future__ import division
 from ..reader import parse_idf_string
 from ..writer import generate_idf_string
 
-from honeybee.typing import valid_ep_string, valid_string, float_in_range
+from honeybee.typing import valid_ep_string, float_in_range
 from ladybug.datatype import fraction, temperature, temperaturedelta, power, \
     angle, speed, distance, uvalue
 
 import os
 import re
 
+_TYPE_LIMIT_PATTERN = re.compile(r"(?i)ScheduleTypeLimits,[\s\S]*?;")
+
 
 class ScheduleTypeLimit(object):
     """Energy schedule type definition.
@@ -28,23 +30,26 @@ class ScheduleTypeLimit(object):
         data_type
         unit
     """
+    __slots__ = ('_name', '_lower_limit', '_upper_limit', '_numeric_type',
+                 '_unit_type', '_data_type', '_unit', '_hash')
     _default_lb_unit_type = {
         'Dimensionless': (fraction.Fraction(), 'fraction'),
         'Temperature': (temperature.Temperature(), 'C'),
         'DeltaTemperature': (temperaturedelta.TemperatureDelta(), 'C'),
-        'PrecipitationRate': [distance.Distance(), 'm'],
-        'Angle': [angle.Angle(), 'degrees'],
-        'ConvectionCoefficient': [uvalue.ConvectionCoefficient(), 'W/m2-K'],
-        'ActivityLevel': [power.ActivityLevel(), 'W'],
-        'Velocity': [speed.Speed(), 'm/s'],
-        'Capacity': [power.Power(), 'W'],
-        'Power': [power.Power(), 'W'],
-        'Availability': [fraction.Fraction(), 'fraction'],
-        'Percent': [fraction.Fraction(), '%'],
-        'Control': [fraction.Fraction(), 'fraction'],
-        'Mode': [fraction.Fraction(), 'fraction']}
+        'PrecipitationRate': (distance.Distance(), 'm'),
+        'Angle': (angle.Angle(), 'degrees'),
+        'ConvectionCoefficient': (uvalue.ConvectionCoefficient(), 'W/m2-K'),
+        'ActivityLevel': (power.ActivityLevel(), 'W'),
+        'Velocity': (speed.Speed(), 'm/s'),
+        'Capacity': (power.Power(), 'W'),
+        'Power': (power.Power(), 'W'),
+        'Availability': (fraction.Fraction(), 'fraction'),
+        'Percent': (fraction.Fraction(), '%'),
+        'Control': (fraction.Fraction(), 'fraction'),
+        'Mode': (fraction.Fraction(), 'fraction')}
 
     UNIT_TYPES = tuple(_default_lb_unit_type.keys())
+    _unit_type_lookup = dict((key.lower(), key) for key in UNIT_TYPES)
     NUMERIC_TYPES = ('Continuous', 'Discrete')
 
     def __init__(self, name, lower_limit=None, upper_limit=None,
@@ -91,17 +96,15 @@ class ScheduleTypeLimit(object):
             self._data_type, self._unit = self._default_lb_unit_type['Dimensionless']
             self._unit_type = 'Dimensionless'
         else:
-            clean_input = valid_string(unit_type).lower()
-            for key in self.UNIT_TYPES:
-                if key.lower() == clean_input:
-                    unit_type = key
-                    break
-            else:
+            # the lookup rejects any text that is not a unit type
+            canonical = self._unit_type_lookup.get(unit_type.lower())
+            if canonical is None:
                 raise ValueError(
                     'unit_type {} is not recognized.\nChoose from the '
                     'following:\n{}'.format(unit_type, self.UNIT_TYPES))
-            self._data_type, self._unit = self._default_lb_unit_type[unit_type]
-            self._unit_type = unit_type
+            self._data_type, self._unit = self._default_lb_unit_type[canonical]
+            self._unit_type = canonical
+        self._hash = None  # computed on first use since the object is immutable
 
     @property
     def name(self):
@@ -173,33 +176,30 @@ class ScheduleTypeLimit(object):
         """
         assert data['type'] == 'ScheduleTypeLimit', \
             'Expected ScheduleTypeLimit dictionary. Got {}.'.format(data['type'])
-        lower_limit = data['lower_limit'] if 'lower_limit' in data else None
-        upper_limit = data['upper_limit'] if 'upper_limit' in data else None
-        numeric_type = data['numeric_type'] if 'numeric_type' in data else 'Continuous'
-        unit_type = data['unit_type'] if 'unit_type' in data else 'Dimensionless'
-        return cls(data['name'], lower_limit, upper_limit, numeric_type, unit_type)
+        return cls(data['name'], data.get('lower_limit'), data.get('upper_limit'),
+                   data.get('numeric_type', 'Continuous'),
+                   data.get('unit_type', 'Dimensionless'))
 
     def to_idf(self):
         """IDF string for the ScheduleTypeLimits of this object."""
-        values = [self.name, self.lower_limit, self.upper_limit,
-                  self.numeric_type, self.unit_type]
-        if values[1] is None:
-            values[1] = ''
-        if values[2] is None:
-            values[2] = ''
+        values = (self._name,
+                  self._lower_limit if self._lower_limit is not None else '',
+                  self._upper_limit if self._upper_limit is not None else '',
+                  self._numeric_type, self._unit_type)
         comments = ('name', 'lower limit value', 'upper limit value',
                     'numeric type', 'unit type')
         return generate_idf_string('ScheduleTypeLimits', values, comments)
 
     def to_dict(self):
         """Shade construction dictionary representation."""
-        base = {'type': 'ScheduleTypeLimit'}
-        base['name'] = self.name
-        base['lower_limit'] = self.lower_limit
-        base['upper_limit'] = self.upper_limit
-        base['numeric_type'] = self.numeric_type
-        base['unit_type'] = self.unit_type
-        return base
+        return {
+            'type': 'ScheduleTypeLimit',
+            'name': self._name,
+            'lower_limit': self._lower_limit,
+            'upper_limit': self._upper_limit,
+            'numeric_type': self._numeric_type,
+            'unit_type': self._unit_type
+        }
 
     @staticmethod
     def extract_all_from_idf_file(idf_file):
@@ -217,21 +217,25 @@ class ScheduleTypeLimit(object):
         with open(idf_file, 'r') as ep_file:
             file_contents = ep_file.read()
         # extract all of the ScheduleTypeLimit objects
-        type_pattern = re.compile(r"(?i)(ScheduleTypeLimits,[\s\S]*?;)")
-        type_idf_strings = type_pattern.findall(file_contents)
-        schedule_type_limits = []
-        for type_str in type_idf_strings:
-            type_str = type_str.strip()
-            schedule_type_limits.append(ScheduleTypeLimit.from_idf(type_str))
-        return schedule_type_limits
+        return [ScheduleTypeLimit.from_idf(type_match.group(0))
+                for type_match in _TYPE_LIMIT_PATTERN.finditer(file_contents)]
 
     def duplicate(self):
         """Get a copy of this object."""
         return self.__copy__()
 
     def __copy__(self):
-        return ScheduleTypeLimit(self.name, self._lower_limit, self._upper_limit,
-                                 self._numeric_type, self._unit_type)
+        # the properties are already validated and can be shared with the copy
+        new_type = ScheduleTypeLimit.__new__(ScheduleTypeLimit)
+        new_type._name = self._name
+        new_type._lower_limit = self._lower_limit
+        new_type._upper_limit = self._upper_limit
+        new_type._numeric_type = self._numeric_type
+        new_type._unit_type = self._unit_type
+        new_type._data_type = self._data_type
+        new_type._unit = self._unit
+        new_type._hash = self._hash
+        return new_type
 
     def __key(self):
         """A tuple based on the object properties, useful for hashing."""
@@ -239,9 +243,13 @@ class ScheduleTypeLimit(object):
                 self._numeric_type, self._unit_type)
 
     def __hash__(self):
-        return hash(self.__key())
+        if self._hash is None:
+            self._hash = hash(self.__key())
+        return self._hash
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return isinstance(other, ScheduleTypeLimit) and self.__key() == other.__key()
 
     def __ne__(self, other):
@@ -6,8 +6,6 @@ from .daylightsaving import DaylightSavingTime
 from ..reader import parse_idf_string
 from ..writer import generate_idf_string
 
-from honeybee.typing import valid_string
-
 from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.dt import Date
 
@@ -23,10 +21,11 @@ class RunPeriod(object):
         * daylight_saving_time
         * is_leap_year
     """
-    __slots__ = ('_start_date', '_end_date', '_start_day_of_week', '_holidays',
-                 '_daylight_saving_time')
+    __slots__ = ('_start_date', '_end_date', '_start_dow', '_holidays',
+                 '_holidays_hash', '_daylight_saving_time')
     DAYS_OF_THE_WEEK = (
         'Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday')
+    _dow_lookup = dict((day.lower(), i) for i, day in enumerate(DAYS_OF_THE_WEEK))
 
     def __init__(self, start_date=Date(1, 1), end_date=Date(12, 31),
                  start_day_of_week='Sunday', holidays=None, daylight_saving_time=None):
@@ -107,20 +106,17 @@ class RunPeriod(object):
             * Friday
             * Saturday
         """
-        return self._start_day_of_week
+        return self.DAYS_OF_THE_WEEK[self._start_dow]
 
     @start_day_of_week.setter
     def start_day_of_week(self, value):
-        clean_input = valid_string(value).lower()
-        for key in self.DAYS_OF_THE_WEEK:
-            if key.lower() == clean_input:
-                value = key
-                break
-        else:
+        # the lookup rejects any text that is not a day of the week
+        dow_index = self._dow_lookup.get(value.lower())
+        if dow_index is None:
             raise ValueError(
                 'start_day_of_week {} is not recognized.\nChoose from the '
                 'following:\n{}'.format(value, self.DAYS_OF_THE_WEEK))
-        self._start_day_of_week = value
+        self._start_dow = dow_index
 
     @property
     def holidays(self):
@@ -135,6 +131,9 @@ class RunPeriod(object):
             for date in value:
                 assert isinstance(date, Date), 'Expected ladybug Date for ' \
                     'RunPeriod holiday. Got {}.'.format(type(date))
+            self._holidays_hash = tuple(hash(hol) for hol in value)
+        else:
+            self._holidays_hash = (None,)
         self._holidays = value
 
     @property
@@ -165,13 +164,16 @@ class RunPeriod(object):
     @is_leap_year.setter
     def is_leap_year(self, value):
         value = bool(value)
-        self._start_date = Date(self._start_date.month, self._start_date.day, value)
-        self._end_date = Date(self._end_date.month, self._end_date.day, value)
-        if self._daylight_saving_time is not None:
-            st_dt = self._daylight_saving_time._start_date
-            ed_dt = self._daylight_saving_time._end_date
-            self._daylight_saving_time._start_date = Date(st_dt.month, st_dt.day, value)
-            self._daylight_saving_time._end_date = Date(ed_dt.month, ed_dt.day, value)
+        st_dt, ed_dt = self._start_date, self._end_date
+        if st_dt.leap_year is not value or ed_dt.leap_year is not value:
+            self._start_date = Date(st_dt.month, st_dt.day, value)
+            self._end_date = Date(ed_dt.month, ed_dt.day, value)
+        dst = self._daylight_saving_time
+        if dst is not None:
+            st_dt, ed_dt = dst._start_date, dst._end_date
+            if st_dt.leap_year is not value or ed_dt.leap_year is not value:
+                dst._start_date = Date(st_dt.month, st_dt.day, value)
+                dst._end_date = Date(ed_dt.month, ed_dt.day, value)
 
     @classmethod
     def from_analysis_period(cls, analysis_period=None, start_day_of_week='Sunday',
@@ -272,14 +274,13 @@ class RunPeriod(object):
             'start_date' in data else Date(1, 1)
         end_date = Date.from_dict(data['end_date']) if \
             'end_date' in data else Date(12, 31)
-        start_day_of_week = data['start_day_of_week'] if \
-            'start_day_of_week' in data else 'Sunday'
-        holidays = None
-        if 'holidays' in data and data['holidays'] is not None:
-            holidays = tuple(Date.from_dict(hol) for hol in data['holidays'])
-        daylight_saving = None
-        if 'daylight_saving_time' in data and data['daylight_saving_time'] is not None:
-            daylight_saving = DaylightSavingTime.from_dict(data['daylight_saving_time'])
+        start_day_of_week = data.get('start_day_of_week', 'Sunday')
+        holidays = data.get('holidays')
+        if holidays is not None:
+            holidays = tuple(Date.from_dict(hol) for hol in holidays)
+        daylight_saving = data.get('daylight_saving_time')
+        if daylight_saving is not None:
+            daylight_saving = DaylightSavingTime.from_dict(daylight_saving)
         return cls(start_date, end_date, start_day_of_week, holidays, daylight_saving)
 
     def to_idf(self):
@@ -294,17 +295,18 @@ class RunPeriod(object):
                 that notes the start and ends dates of Daylight Savings time. Will be
                 None if no daylight_saving_time is applied to this RunPeriod.
         """
-        year = 2016 if self.is_leap_year else 2017
-        values = ('CustomRunPeriod', self.start_date.month, self.start_date.day, year,
-                  self.end_date.month, self.end_date.day, year,
-                  self.start_day_of_week, 'Yes', 'Yes')
+        st_date, end_date = self._start_date, self._end_date
+        year = 2016 if st_date.leap_year else 2017
+        values = ('CustomRunPeriod', st_date.month, st_date.day, year,
+                  end_date.month, end_date.day, year,
+                  self.DAYS_OF_THE_WEEK[self._start_dow], 'Yes', 'Yes')
         comments = ('name', 'start month', 'start day', 'start year',
                     'end month', 'end day', 'end year', 'start day of week',
                     'use weather file holidays', 'use weather file daylight savings')
         run_period = generate_idf_string('RunPeriod', values, comments)
 
         holidays = [self._holiday_to_idf(hol, i) for i, hol in
-                    enumerate(self.holidays)] if self.holidays is not None else None
+                    enumerate(self._holidays)] if self._holidays is not None else None
 
         daylight_saving_time = self.daylight_saving_time.to_idf() if \
             self.daylight_saving_time is not None else None
@@ -315,14 +317,14 @@ class RunPeriod(object):
         """RunPeriod dictionary representation."""
         base = {
             'type': 'RunPeriod',
-            'start_date': self.start_date.to_dict(),
-            'end_date': self.end_date.to_dict(),
-            'start_day_of_week': self.start_day_of_week
+            'start_date': self._start_date.to_dict(),
+            'end_date': self._end_date.to_dict(),
+            'start_day_of_week': self.DAYS_OF_THE_WEEK[self._start_dow]
         }
-        if self.holidays is not None:
-            base['holidays'] = [hol.to_dict() for hol in self.holidays]
-        if self.daylight_saving_time is not None:
-            base['daylight_saving_time'] = self.daylight_saving_time.to_dict()
+        if self._holidays is not None:
+            base['holidays'] = [hol.to_dict() for hol in self._holidays]
+        if self._daylight_saving_time is not None:
+            base['daylight_saving_time'] = self._daylight_saving_time.to_dict()
         return base
 
     def duplicate(self):
@@ -331,10 +333,11 @@ class RunPeriod(object):
 
     def _check_start_before_end(self):
         """Check that the start_date is before the end_date."""
-        assert self.start_date.leap_year is self.end_date.leap_year, \
+        st_date, end_date = self._start_date, self._end_date
+        assert st_date.leap_year is end_date.leap_year, \
             'RunPeriod start_date.leap_year must match the end_date.leap_year'
-        assert self._start_date < self._end_date, 'RunPeriod start_date must come ' \
-            'before end_date. {} comes after {}.'.format(self.start_date, self.end_date)
+        assert st_date < end_date, 'RunPeriod start_date must come ' \
+            'before end_date. {} comes after {}.'.format(st_date, end_date)
 
     @staticmethod
     def _check_date(date, date_name='date'):
@@ -343,10 +346,15 @@ class RunPeriod(object):
 
     @staticmethod
     def _holiday_to_idf(date, count):
-        """Convert a ladybug Date object to an IDF holiday string."""
-        values = ('Holiday_{}'.format(count), '{}/{}'.format(date.month, date.day))
-        comments = ('name', 'date')
-        return generate_idf_string('RunPeriodControl:SpecialDays', values, comments)
+        """Convert a ladybug Date object to an IDF holiday string.
+
+        The string is written with a fixed template that matches the output of
+        generate_idf_string for this two-field object.
+        """
+        name = 'Holiday_{}'.format(count)
+        date_str = '{}/{}'.format(date.month, date.day)
+        return 'RunPeriodControl:SpecialDays,\n {},{}!- name\n {};{}!- date'.format(
+            name, ' ' * max(25 - len(name), 1), date_str, ' ' * (25 - len(date_str)))
 
     def ToString(self):
         """Overwrite .NET ToString."""
@@ -360,15 +368,15 @@ class RunPeriod(object):
 
     def __key(self):
         """A tuple based on the object properties, useful for hashing."""
-        hol_tup = tuple(hash(hol) for hol in self.holidays) if \
-            self.holidays is not None else (None,)
-        return (hash(self.start_date), hash(self.end_date), self.start_day_of_week,
-                hash(self.daylight_saving_time)) + hol_tup
+        return (hash(self._start_date), hash(self._end_date), self._start_dow,
+                hash(self._daylight_saving_time)) + self._holidays_hash
 
     def __hash__(self):
         return hash(self.__key())
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return isinstance(other, RunPeriod) and self.__key() == other.__key()
 
     def __ne__(self, other):
@@ -5,7 +5,7 @@ from __future__ import division
 from ..reader import parse_idf_string
 from ..writer import generate_idf_string
 
-from honeybee.typing import valid_string, int_in_range
+from honeybee.typing import int_in_range
 
 
 class ShadowCalculation(object):
@@ -18,11 +18,13 @@ class ShadowCalculation(object):
         * maximum_figures
     """
     __slots__ = ('_solar_distribution', '_calculation_method', '_calculation_frequency',
-                 '_maximum_figures')
+                 '_maximum_figures', '_hash', '_idf_cache')
     SOLAR_DISTRIBUTIONS = (
         'MinimalShadowing', 'FullExterior', 'FullInteriorAndExterior',
         'FullExteriorWithReflections', 'FullInteriorAndExteriorWithReflections')
     CALCULATION_METHODS = ('AverageOverDaysInFrequency', 'TimestepFrequency')
+    _solar_lookup = dict((key.lower(), key) for key in SOLAR_DISTRIBUTIONS)
+    _method_lookup = dict((key.lower(), key) for key in CALCULATION_METHODS)
 
     def __init__(self, solar_distribution='FullInteriorAndExteriorWithReflections',
                  calculation_method='AverageOverDaysInFrequency',
@@ -70,16 +72,15 @@ class ShadowCalculation(object):
 
     @solar_distribution.setter
     def solar_distribution(self, value):
-        clean_input = valid_string(value).lower()
-        for key in self.SOLAR_DISTRIBUTIONS:
-            if key.lower() == clean_input:
-                value = key
-                break
-        else:
-            raise ValueError(
-                'solar_distribution {} is not recognized.\nChoose from the '
-                'following:\n{}'.format(value, self.SOLAR_DISTRIBUTIONS))
+        if value not in self.SOLAR_DISTRIBUTIONS:  # not already the canonical text
+            canonical = self._solar_lookup.get(value.lower())
+            if canonical is None:
+                raise ValueError(
+                    'solar_distribution {} is not recognized.\nChoose from the '
+                    'following:\n{}'.format(value, self.SOLAR_DISTRIBUTIONS))
+            value = canonical
         self._solar_distribution = value
+        self._hash = self._idf_cache = None
 
     @property
     def calculation_method(self):
@@ -93,16 +94,15 @@ class ShadowCalculation(object):
 
     @calculation_method.setter
     def calculation_method(self, value):
-        clean_input = valid_string(value).lower()
-        for key in self.CALCULATION_METHODS:
-            if key.lower() == clean_input:
-                value = key
-                break
-        else:
-            raise ValueError(
-                'calculation_method {} is not recognized.\nChoose from the '
-                'following:\n{}'.format(value, self.CALCULATION_METHODS))
+        if value not in self.CALCULATION_METHODS:  # not already the canonical text
+            canonical = self._method_lookup.get(value.lower())
+            if canonical is None:
+                raise ValueError(
+                    'calculation_method {} is not recognized.\nChoose from the '
+                    'following:\n{}'.format(value, self.CALCULATION_METHODS))
+            value = canonical
         self._calculation_method = value
+        self._hash = self._idf_cache = None
 
     @property
     def calculation_frequency(self):
@@ -113,6 +113,7 @@ class ShadowCalculation(object):
     def calculation_frequency(self, value):
         self._calculation_frequency = int_in_range(
             value, 1, input_name='shadow calculation calculation frequency')
+        self._hash = self._idf_cache = None
 
     @property
     def maximum_figures(self):
@@ -123,6 +124,7 @@ class ShadowCalculation(object):
     def maximum_figures(self, value):
         self._maximum_figures = int_in_range(
             value, 200, input_name='shadow calculation maximum figures')
+        self._hash = self._idf_cache = None
 
     @classmethod
     def from_idf(cls, idf_string,
@@ -139,15 +141,14 @@ class ShadowCalculation(object):
         ep_strs = parse_idf_string(idf_string, 'ShadowCalculation,')
 
         # extract the properties from the string
-        calculation_method = 'AverageOverDaysInFrequency'
-        calculation_frequency = 20
-        maximum_figures = 15000
-        try:
-            calculation_method = ep_strs[0] if ep_strs[0] != '' else calculation_method
-            calculation_frequency = ep_strs[1] if ep_strs[1] != '' else 20
-            maximum_figures = ep_strs[2] if ep_strs[2] != '' else 15000
-        except IndexError:
-            pass  # shorter ShadowCalculation definition
+        # shorter ShadowCalculation definitions leave the remaining defaults in place
+        field_count = len(ep_strs)
+        calculation_method = ep_strs[0] if field_count > 0 and ep_strs[0] != '' \
+            else 'AverageOverDaysInFrequency'
+        calculation_frequency = ep_strs[1] if field_count > 1 and ep_strs[1] != '' \
+            else 20
+        maximum_figures = ep_strs[2] if field_count > 2 and ep_strs[2] != '' \
+            else 15000
 
         # return the object and the zone name for the object
         return cls(solar_distribution, calculation_method, calculation_frequency,
@@ -172,23 +173,20 @@ class ShadowCalculation(object):
         """
         assert data['type'] == 'ShadowCalculation', \
             'Expected ShadowCalculation dictionary. Got {}.'.format(data['type'])
-        solar_distribution = data['solar_distribution'] if \
-            'solar_distribution' in data else 'FullInteriorAndExteriorWithReflections'
-        calculation_method = data['calculation_method'] if \
-            'calculation_method' in data else 'AverageOverDaysInFrequency'
-        calculation_frequency = data['calculation_frequency'] if \
-            'calculation_frequency' in data else 30
-        maximum_figures = data['maximum_figures'] if \
-            'maximum_figures' in data else 15000
-        return cls(solar_distribution, calculation_method, calculation_frequency,
-                   maximum_figures)
+        return cls(
+            data.get('solar_distribution', 'FullInteriorAndExteriorWithReflections'),
+            data.get('calculation_method', 'AverageOverDaysInFrequency'),
+            data.get('calculation_frequency', 30), data.get('maximum_figures', 15000))
 
     def to_idf(self):
         """Get an EnergyPlus string representation of the ShadowCalculation."""
-        values = (self.calculation_method, self.calculation_frequency,
-                  self.maximum_figures)
-        comments = ('calculation method', 'calculation frequency', 'maximum figures')
-        return generate_idf_string('ShadowCalculation', values, comments)
+        if self._idf_cache is None:  # reset by each of the property setters
+            values = (self._calculation_method, self._calculation_frequency,
+                      self._maximum_figures)
+            comments = ('calculation method', 'calculation frequency',
+                        'maximum figures')
+            self._idf_cache = generate_idf_string('ShadowCalculation', values, comments)
+        return self._idf_cache
 
     def to_dict(self):
         """ShadowCalculation dictionary representation."""
@@ -209,16 +207,25 @@ class ShadowCalculation(object):
         return self.__repr__()
 
     def __copy__(self):
-        return ShadowCalculation(self.solar_distribution, self.calculation_method,
-                                 self.calculation_frequency, self.maximum_figures)
+        # the properties are already validated and can be shared with the copy
+        new_calc = ShadowCalculation.__new__(ShadowCalculation)
+        new_calc._solar_distribution = self._solar_distribution
+        new_calc._calculation_method = self._calculation_method
+        new_calc._calculation_frequency = self._calculation_frequency
+        new_calc._maximum_figures = self._maximum_figures
+        new_calc._hash = self._hash
+        new_calc._idf_cache = self._idf_cache
+        return new_calc
 
     def __key(self):
         """A tuple based on the object properties, useful for hashing."""
-        return (self.solar_distribution, self.calculation_method,
-                self.calculation_frequency, self.maximum_figures)
+        return (self._solar_distribution, self._calculation_method,
+                self._calculation_frequency, self._maximum_figures)
 
     def __hash__(self):
-        return hash(self.__key())
+        if self._hash is None:  # reset by each of the property setters
+            self._hash = hash(self.__key())
+        return self._hash
 
     def __eq__(self, other):
         return isinstance(other, ShadowCalculation) and self.__key() == other.__key()
@@ -12,6 +12,9 @@ try:
 except ImportError:
     xrange = range  # python 3
 
+# spaces between each value and its comment, indexed by the length of the value text
+_COMMENT_SPACES = tuple(' ' * max(25 - i, 1) for i in range(26))
+
 
 def generate_idf_string(object_type, values, comments=None):
     """Get an IDF string representation of an EnergyPlus object.
@@ -28,25 +31,21 @@ def generate_idf_string(object_type, values, comments=None):
         ep_str: Am EnergyPlus IDF string representing a single object.
     """
     if comments is not None:
-        space_count = tuple((25 - len(str(n))) for n in values)
-        spaces = tuple(s_c * ' ' if s_c > 0 else ' ' for s_c in space_count)
-        body_str = '\n '.join('{},{}!- {}'.format(val, spc, com) for val, spc, com in
-                              zip(values[:-1], spaces[:-1], comments[:-1]))
-        ep_str = '{},\n {}'.format(object_type, body_str)
-        if len(values) == 1:  # ensure we don't have an extra line break
-            ep_str = ''.join(
-                (ep_str, '{};{}!- {}'.format(values[-1], spaces[-1], comments[-1])))
-        else:  # include an extra line break
-            end_str = '\n {};{}!- {}'.format(values[-1], spaces[-1], comments[-1]) \
-                if comments[-1] != '' else '\n {};'.format(values[-1])
-            ep_str = ''.join((ep_str, end_str))
-    else:
-        body_str = '\n '.join('{},'.format(val) for val in values[:-1])
-        ep_str = '{},\n {}'.format(object_type, body_str)
+        val_strs = [str(val) for val in values]
+        body_str = '\n '.join(
+            '%s,%s!- %s' % (val, _COMMENT_SPACES[min(len(val), 25)], com)
+            for val, com in zip(val_strs[:-1], comments[:-1]))
+        ep_str = '%s,\n %s' % (object_type, body_str)
+        last_val = val_strs[-1]
+        last_spc = _COMMENT_SPACES[min(len(last_val), 25)]
         if len(values) == 1:  # ensure we don't have an extra line break
-            ep_str = ''.join((ep_str, '{};'.format(values[-1])))
-        else:  # include an extra line break
-            ep_str = ''.join((ep_str, '\n {};'.format(values[-1])))
+            ep_str = '%s%s;%s!- %s' % (ep_str, last_val, last_spc, comments[-1])
+        elif comments[-1] != '':  # include an extra line break
+            ep_str = '%s\n %s;%s!- %s' % (ep_str, last_val, last_spc, comments[-1])
+        else:  # include an extra line break without a comment
+            ep_str = '%s\n %s;' % (ep_str, last_val)
+    else:  # all values follow one another with the same separator
+        ep_str = '%s,\n %s;' % (object_type, ',\n '.join([str(val) for val in values]))
     return ep_str
 
 
@@ -58,19 +57,19 @@ def door_to_idf(door):
     Args:
         door: A honeyee Door for which an IDF representation will be returned.
     """
-    door_bc_obj = door.boundary_condition.boundary_condition_object if \
-        isinstance(door.boundary_condition, Surface) else ''
+    door_bc = door.boundary_condition
+    door_bc_obj = door_bc.boundary_condition_object if \
+        isinstance(door_bc, Surface) else ''
     values = (door.name,
               'Door' if not door.is_glass else 'GlassDoor',
               door.properties.energy.construction.name,
               door.parent.name if door.has_parent else 'unknown',
               door_bc_obj,
-              door.boundary_condition.view_factor,
+              door_bc.view_factor,
               '',  # TODO: Implement Frame and Divider objects on WindowConstructions
               '1',
               len(door.vertices),
-              ',\n '.join('%.3f, %.3f, %.3f' % (v.x, v.y, v.z)
-                          for v in door.upper_left_vertices))
+              _vertices_to_idf(door.upper_left_vertices))
     comments = ('name',
                 'surface type',
                 'construction name',
@@ -96,19 +95,19 @@ def aperture_to_idf(aperture):
     Args:
         aperture: A honeyee Aperture for which an IDF representation will be returned.
     """
-    ap_bc_obj = aperture.boundary_condition.boundary_condition_object if \
-        isinstance(aperture.boundary_condition, Surface) else ''
+    ap_bc = aperture.boundary_condition
+    ap_bc_obj = ap_bc.boundary_condition_object if \
+        isinstance(ap_bc, Surface) else ''
     values = (aperture.name,
               'Window',
               aperture.properties.energy.construction.name,
               aperture.parent.name if aperture.has_parent else 'unknown',
               ap_bc_obj,
-              aperture.boundary_condition.view_factor,
+              ap_bc.view_factor,
               '',  # TODO: Implement Frame and Divider objects on WindowConstructions
               '1',
               len(aperture.vertices),
-              ',\n '.join('%.3f, %.3f, %.3f' % (v.x, v.y, v.z)
-                          for v in aperture.upper_left_vertices))
+              _vertices_to_idf(aperture.upper_left_vertices))
     comments = ('name',
                 'surface type',
                 'construction name',
@@ -147,8 +146,7 @@ def shade_to_idf(shade):
                   base_srf,
                   trans_sched,
                   len(shade.vertices),
-                  ',\n '.join('%.3f, %.3f, %.3f' % (v.x, v.y, v.z)
-                              for v in shade.upper_left_vertices))
+                  _vertices_to_idf(shade.upper_left_vertices))
         comments = ('name',
                     'base surface',
                     'transmittance schedule',
@@ -159,8 +157,7 @@ def shade_to_idf(shade):
         values = (shade.name,
                   trans_sched,
                   len(shade.vertices),
-                  ',\n '.join('%.3f, %.3f, %.3f' % (v.x, v.y, v.z)
-                              for v in shade.upper_left_vertices))
+                  _vertices_to_idf(shade.upper_left_vertices))
         comments = ('name',
                     'transmittance schedule',
                     'number of vertices',
@@ -199,27 +196,28 @@ def face_to_idf(face):
     Args:
         face: A honeyee Face for which an IDF representation will be returned.
     """
-    if isinstance(face.type, RoofCeiling):
-        face_type = 'Roof' if isinstance(face.boundary_condition, (Outdoors, Ground)) \
+    face_bc = face.boundary_condition
+    face_type = face.type
+    if isinstance(face_type, RoofCeiling):
+        face_type = 'Roof' if isinstance(face_bc, (Outdoors, Ground)) \
             else 'Ceiling'  # EnergyPlus distinguishes between Roof and Ceiling
-    elif isinstance(face.type, AirWall):
+    elif isinstance(face_type, AirWall):
         face_type = 'Wall'  # air walls are not a Surface type in EnergyPlus
     else:
-        face_type = face.type.name
-    face_bc_obj = face.boundary_condition.boundary_condition_object if \
-        isinstance(face.boundary_condition, Surface) else ''
+        face_type = face_type.name
+    face_bc_obj = face_bc.boundary_condition_object if \
+        isinstance(face_bc, Surface) else ''
     values = (face.name,
               face_type,
               face.properties.energy.construction.name,
               face.parent.name if face.has_parent else 'unknown',
-              face.boundary_condition.name,
+              face_bc.name,
               face_bc_obj,
-              face.boundary_condition.sun_exposure_idf,
-              face.boundary_condition.wind_exposure_idf,
-              face.boundary_condition.view_factor,
+              face_bc.sun_exposure_idf,
+              face_bc.wind_exposure_idf,
+              face_bc.view_factor,
               len(face.vertices),
-              ',\n '.join('%.3f, %.3f, %.3f' % (v.x, v.y, v.z)
-                          for v in face.upper_left_vertices))
+              _vertices_to_idf(face.upper_left_vertices))
     comments = ('name',
                 'surface type',
                 'construction name',
@@ -264,35 +262,27 @@ def room_to_idf(room):
     zone_str.append(generate_idf_string('Zone', zone_values, zone_comments))
 
     # write the load definitions
-    people = room.properties.energy.people
-    lighting = room.properties.energy.lighting
-    electric_equipment = room.properties.energy.electric_equipment
-    gas_equipment = room.properties.energy.gas_equipment
-    infiltration = room.properties.energy.infiltration
-    ventilation = room.properties.energy.ventilation
-    window_shade_control  = room.properties.energy.shade_control
-
-    if people is not None:
-        zone_str.append(people.to_idf(room.name))
-    if lighting is not None:
-        zone_str.append(lighting.to_idf(room.name))
-    if electric_equipment is not None:
-        zone_str.append(electric_equipment.to_idf(room.name))
-    if gas_equipment is not None:
-        zone_str.append(gas_equipment.to_idf(room.name))
-    if infiltration is not None:
-        zone_str.append(infiltration.to_idf(room.name))
-
+    room_energy = room.properties.energy
+    room_name = room.name
+    for load in (room_energy.people, room_energy.lighting,
+                 room_energy.electric_equipment, room_energy.gas_equipment,
+                 room_energy.infiltration):
+        if load is not None:
+            zone_str.append(load.to_idf(room_name))
+
+    window_shade_control = room_energy.shade_control
     if window_shade_control is not None:
         zone_str.append(window_shade_control.to_idf())
 
     # write the ventilation, thermostat, and ideal air system
+    ventilation = room_energy.ventilation
     if ventilation is not None:
-        zone_str.append(ventilation.to_idf(room.name))
-    if room.properties.energy.is_conditioned:
-        zone_str.append(room.properties.energy.hvac.to_idf())
-        zone_str.append(room.properties.energy.setpoint.to_idf(room.name))
-        humidistat = room.properties.energy.setpoint.to_idf_humidistat(room.name)
+        zone_str.append(ventilation.to_idf(room_name))
+    if room_energy.is_conditioned:
+        setpoint = room_energy.setpoint
+        zone_str.append(room_energy.hvac.to_idf())
+        zone_str.append(setpoint.to_idf(room_name))
+        humidistat = setpoint.to_idf_humidistat(room_name)
         if humidistat is not None:
             zone_str.append(humidistat)
 
@@ -372,13 +362,15 @@ def model_to_idf(model, schedule_directory=None,
     model_str = ['!-   =======================================\n'
                  '!-   ================ MODEL ================\n'
                  '!-   =======================================\n']
-    model_str.append(model.properties.energy.building_idf(solar_distribution))
+    model_energy = model.properties.energy
+    model_str.append(model_energy.building_idf(solar_distribution))
 
     # write all of the schedules and type limits
     sched_strs = []
     type_limits = []
+    type_limit_set = set()  # equal type limits must only be written once
     sched_dir = None
-    for sched in model.properties.energy.schedules:
+    for sched in model_energy.schedules:
         try:
             year_schedule, week_schedules = sched.to_idf()
             if week_schedules is None:
@@ -386,7 +378,9 @@ def model_to_idf(model, schedule_directory=None,
             else:
                 day_scheds = [day.to_idf(sched.schedule_type_limit)
                               for day in sched.day_schedules]
-                sched_strs.extend([year_schedule] + week_schedules + day_scheds)
+                sched_strs.append(year_schedule)
+                sched_strs.extend(week_schedules)
+                sched_strs.extend(day_scheds)
         except AttributeError:  # ScheduleFixedInterval
             if sched_dir is None:
                 sched_dir = schedule_directory if schedule_directory is not None \
@@ -394,19 +388,24 @@ def model_to_idf(model, schedule_directory=None,
                                       'unnamed', 'schedules')
             sched_strs.append(sched.to_idf(sched_dir))
         t_lim = sched.schedule_type_limit
-        if t_lim is not None and not _instance_in_array(t_lim, type_limits):
+        if t_lim is not None and t_lim not in type_limit_set:
+            type_limit_set.add(t_lim)
             type_limits.append(t_lim)
     model_str.append('!-   ========= SCHEDULE TYPE LIMITS =========\n')
-    model_str.extend([type_limit.to_idf() for type_limit in set(type_limits)])
+    model_str.extend([type_limit.to_idf() for type_limit in type_limits])
     model_str.append('!-   ============== SCHEDULES ==============\n')
     model_str.extend(sched_strs)
 
     # write all of the materials and constructions
     materials = []
+    material_set = set()  # equal materials must only be written once
     construction_strs = []
-    for constr in model.properties.energy.constructions:
+    for constr in model_energy.constructions:
         try:
-            materials.extend(constr.materials)
+            for mat in constr.materials:
+                if mat not in material_set:
+                    material_set.add(mat)
+                    materials.append(mat)
             construction_strs.append(constr.to_idf())
         except AttributeError:
             try:
@@ -415,44 +414,42 @@ def model_to_idf(model, schedule_directory=None,
             except:
                 pass  # ShadeConstruction; No need to write to IDF
     model_str.append('!-   ============== MATERIALS ==============\n')
-    model_str.extend([mat.to_idf() for mat in set(materials)])
+    model_str.extend([mat.to_idf() for mat in materials])
     model_str.append('!-   ============ CONSTRUCTIONS ============\n')
     model_str.extend(construction_strs)
 
     # write all of the zone geometry
     model_str.append('!-   ============ ZONE GEOMETRY ============\n')
     for room in model.rooms:
-        model_str.append(room.to.idf(room))
+        model_str.append(room_to_idf(room))
         for face in room.faces:
-            model_str.append(face.to.idf(face))
+            model_str.append(face_to_idf(face))
             for ap in face.apertures:
-                model_str.append(ap.to.idf(ap))
+                model_str.append(aperture_to_idf(ap))
                 for shade in ap.outdoor_shades:
-                    model_str.append(shade.to.idf(shade))
+                    model_str.append(shade_to_idf(shade))
             for dr in face.doors:
-                model_str.append(dr.to.idf(dr))
+                model_str.append(door_to_idf(dr))
             for shade in face.outdoor_shades:
-                model_str.append(shade.to.idf(shade))
+                model_str.append(shade_to_idf(shade))
         for shade in room.outdoor_shades:
-            model_str.append(shade.to.idf(shade))
+            model_str.append(shade_to_idf(shade))
 
     # write all context shade geometry
     model_str.append('!-   ========== CONTEXT GEOMETRY ==========\n')
     for shade in model.orphaned_shades:
-        model_str.append(shade.to.idf(shade))
+        model_str.append(shade_to_idf(shade))
 
     return '\n\n'.join(model_str)
 
 
-def _instance_in_array(object_instance, object_array):
-    """Check if a specific object instance is already in an array.
+def _vertices_to_idf(vertices):
+    """Get the IDF text for the coordinates of a list of Point3Ds.
 
-    This can be much faster than  `if object_instance in object_arrary`
-    when you expect to be testing a lot of the same instance of an object for
-    inclusion in an array since the builtin method uses an == operator to
-    test inclusion.
+    All coordinates are written with a single string format operation rather
+    than formatting each vertex separately.
     """
-    for val in object_array:
-        if val is object_instance:
-            return True
-    return False
+    coords = []
+    for pt in vertices:
+        coords.extend((pt.x, pt.y, pt.z))
+    return ',\n '.join(('%.3f, %.3f, %.3f',) * (len(coords) // 3)) % tuple(coords)
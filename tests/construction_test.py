@@ -66,6 +66,8 @@ def test_opaque_lockability():
 
     wall_constr.materials = [concrete, wall_gap, gypsum]
     wall_constr.lock()
+    locked_hash = hash(wall_constr)
+    assert hash(wall_constr) == locked_hash
     with pytest.raises(AttributeError):
         wall_constr.materials = [concrete, insulation, wall_gap, gypsum]
     with pytest.raises(AttributeError):
@@ -73,6 +75,7 @@ def test_opaque_lockability():
     wall_constr.unlock()
     wall_constr.materials = [concrete, insulation, wall_gap, gypsum]
     wall_constr[0].density = 600
+    assert hash(wall_constr) != locked_hash
 
 
 def test_opaque_equivalency():
@@ -168,6 +171,9 @@ def test_opaque_construction_from_idf():
     assert wall_constr.thickness == new_wall_constr.thickness
     assert constr_str == new_constr_str
 
+    sym_constr = OpaqueConstruction('Sym Construction', [gypsum, wall_gap, gypsum])
+    assert sym_constr.unique_materials == [gypsum, wall_gap]
+
 
 def test_opaque_dict_methods():
     """Test the to/from dict methods."""
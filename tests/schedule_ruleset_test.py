@@ -69,6 +69,24 @@ def test_schedule_ruleset_equality():
     assert schedule != residential_schedule
 
 
+def test_schedule_ruleset_day_schedules():
+    """Test that day_schedules removes equal days that share the same name."""
+    day_a = ScheduleDay('Office Occupancy', [0, 1, 0],
+                        [Time(0, 0), Time(9, 0), Time(17, 0)])
+    day_b = ScheduleDay('Office Occupancy', [0, 0.5, 0],
+                        [Time(0, 0), Time(9, 0), Time(17, 0)])
+    day_c = day_b.duplicate()
+    schedule = ScheduleRuleset(
+        'Office Occupancy', day_a,
+        [ScheduleRule(day_b, apply_saturday=True),
+         ScheduleRule(day_c, apply_sunday=True)], schedule_types.fractional)
+
+    day_scheds = schedule.day_schedules
+    assert len(day_scheds) == 2
+    assert day_scheds[0] is day_a
+    assert day_scheds[1] is day_b
+
+
 def test_schedule_ruleset_lockability():
     """Test the lockability of ScheduleRuleset objects."""
     weekday_office = ScheduleDay('Weekday Office Occupancy', [0, 1, 0],
@@ -82,6 +100,8 @@ def test_schedule_ruleset_lockability():
 
     schedule.schedule_rules[0].apply_monday = True
     schedule.lock()
+    locked_hash = hash(schedule)
+    assert hash(schedule) == locked_hash
     with pytest.raises(AttributeError):
         schedule.schedule_rules[0].apply_monday = False
     with pytest.raises(AttributeError):
@@ -89,6 +109,7 @@ def test_schedule_ruleset_lockability():
     schedule.unlock()
     schedule.schedule_rules[0].apply_monday = False
     schedule.default_day_schedule.remove_value_by_time(Time(17, 0))
+    assert hash(schedule) != locked_hash
 
 
 def test_schedule_ruleset_values():
@@ -116,6 +137,14 @@ def test_schedule_ruleset_values():
     sch_week_vals_10_min = schedule.values(6, end_date=Date(1, 7))
     assert len(sch_week_vals_10_min) == 24 * 7 * 6
 
+    sch_fri_vals = schedule.values(end_date=Date(1, 3), start_dow='Friday')
+    assert sch_fri_vals[:24] == weekday_office.values_at_timestep()
+    assert sch_fri_vals[24:48] == saturday_office.values_at_timestep()
+    assert sch_fri_vals[48:] == sunday_office.values_at_timestep()
+    sch_thu_vals = schedule.values(end_date=Date(1, 3), start_dow='thursday')
+    assert sch_thu_vals[:48] == weekday_office.values_at_timestep() * 2
+    assert sch_thu_vals[48:] == saturday_office.values_at_timestep()
+
 
 def test_schedule_ruleset_data_collection():
     """Test the ScheduleRuleset data_collection method."""
@@ -189,6 +218,8 @@ def test_schedule_ruleset_from_week_daily_values():
     assert len(schedule.schedule_rules) == 2
     assert schedule.summer_designday_schedule.values_at_timestep() == weekday
     assert schedule.winter_designday_schedule.values_at_timestep() == sun
+    assert schedule.summer_designday_schedule.name == 'Office Occ_Monday_SmrDsn'
+    assert schedule.winter_designday_schedule.name == 'Office Occ_Sunday_WntrDsn'
 
     sch_week_vals = schedule.values(end_date=Date(1, 7))
     assert sch_week_vals == sun + weekday + weekday + weekday + weekday + weekday + sat
@@ -27,7 +27,12 @@ def test_schedule_typelimit_equality():
     temperature = ScheduleTypeLimit('Temperature', -273.15, None, 'Continuous', 'Temperature')
 
     assert fractional == fract_dup
+    assert fractional is not fract_dup
+    assert fract_dup.unit == fractional.unit
     assert fractional != temperature
+    assert hash(fractional) == hash(fract_dup)
+    assert hash(fractional) == hash(fractional)
+    assert len(set((fractional, fract_dup, temperature))) == 2
 
 
 def test_schedule_typelimit_to_from_idf():
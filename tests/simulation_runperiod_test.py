@@ -1,6 +1,7 @@
 # coding=utf-8
 from honeybee_energy.simulation.runperiod import RunPeriod
 from honeybee_energy.simulation.daylightsaving import DaylightSavingTime
+from honeybee_energy.writer import generate_idf_string
 
 from ladybug.dt import Date
 
@@ -124,6 +125,8 @@ def test_run_period_init_from_idf():
     run_period.daylight_saving_time = DaylightSavingTime()
 
     rp_str, holidays, dst = run_period.to_idf()
+    assert holidays[1] == generate_idf_string(
+        'RunPeriodControl:SpecialDays', ('Holiday_1', '3/17'), ('name', 'date'))
     rebuilt_run_period = RunPeriod.from_idf(rp_str, holidays, dst)
     assert run_period == rebuilt_run_period
     assert rebuilt_run_period.to_idf() == (rp_str, holidays, dst)
@@ -18,6 +18,7 @@ def test_shadow_calculation_init():
 def test_shadow_calculation_setability():
     """Test the setting of properties of ShadowCalculation."""
     shadow_calc = ShadowCalculation()
+    assert '30,' in shadow_calc.to_idf()
 
     shadow_calc.solar_distribution = 'fullexterior'
     assert shadow_calc.solar_distribution == 'FullExterior'
@@ -25,6 +26,7 @@ def test_shadow_calculation_setability():
     assert shadow_calc.calculation_method == 'TimestepFrequency'
     shadow_calc.calculation_frequency = 20
     assert shadow_calc.calculation_frequency == 20
+    assert '20,' in shadow_calc.to_idf()
     shadow_calc.maximum_figures = 5000
     assert shadow_calc.maximum_figures == 5000
 
@@ -38,8 +40,10 @@ def test_simulation_control_equality():
     assert shadow_calc is shadow_calc
     assert shadow_calc is not shadow_calc_dup
     assert shadow_calc == shadow_calc_dup
+    assert hash(shadow_calc) == hash(shadow_calc_dup)
     shadow_calc_dup.solar_distribution = 'FullExterior'
     assert shadow_calc != shadow_calc_dup
+    assert hash(shadow_calc) != hash(shadow_calc_dup)
     assert shadow_calc != shadow_calc_alt
 
 